@@ -0,0 +1,66 @@
+"""
+Gunicorn worker classes for the ASGI app (see gunicorn.conf.py).
+"""
+
+from time import perf_counter
+
+from uvicorn.workers import UvicornWorker as BaseUvicornWorker
+
+
+class AccessLogMiddleware:
+    """ASGI wrapper writing one access line per HTTP request, with its duration.
+
+    The line has the fields of gunicorn's ``access_log_format`` in
+    gunicorn.conf.py: client, request line, status, bytes, milliseconds and
+    user agent.
+    """
+
+    def __init__(self, app, logger):
+        self.app = app
+        self.logger = logger
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        start = perf_counter()
+        status, size = 500, 0
+
+        async def send_and_count(message):
+            nonlocal status, size
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            elif message['type'] == 'http.response.body':
+                size += len(message.get('body', b''))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_count)
+        finally:
+            self.log(scope, status, size, (perf_counter() - start) * 1000)
+
+    def log(self, scope, status, size, ms):
+        client = scope['client'][0] if scope.get('client') else '-'
+        query = scope.get('query_string', b'').decode('latin-1')
+        target = scope['path'] + (f'?{query}' if query else '')
+        headers = dict(scope.get('headers', ()))
+        agent = headers.get(b'user-agent', b'-').decode('latin-1')
+        self.logger.info(
+            f'{client} "{scope["method"]} {target} HTTP/{scope.get("http_version", "1.1")}" '
+            f'{status} {size}B {ms:.0f}ms "{agent}"'
+        )
+
+
+class UvicornWorker(BaseUvicornWorker):
+    """Uvicorn worker whose access log carries the request duration.
+
+    Uvicorn's own access lines have no timing and ignore
+    ``access_log_format``, so they are turned off and the app is wrapped in
+    :class:`AccessLogMiddleware`, which writes to gunicorn's access log.
+    """
+    CONFIG_KWARGS = {**BaseUvicornWorker.CONFIG_KWARGS, 'access_log': False}
+
+    def load_wsgi(self):
+        super().load_wsgi()
+        if self.cfg.accesslog:
+            self.wsgi = AccessLogMiddleware(self.wsgi, self.log.access_log)
@@ -0,0 +1,69 @@
+"""Gunicorn settings, picked up automatically from the working directory.
+
+Every value can be overridden through the environment (see README "Serving").
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+cpu_count = multiprocessing.cpu_count()
+
+# ===== BIND =====
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# ===== WORKERS =====
+# Uvicorn workers handle many connections per process on the event loop, so
+# one per CPU keeps every core busy; at least two, so one keeps serving
+# while the other is recycled. Sync and gthread workers block while a
+# request waits, hence the usual 2 * CPUs + 1. For WSGI, set
+# GUNICORN_WORKER_CLASS=gthread so each worker gets `threads`.
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'Banquet.workers.UvicornWorker')
+default_workers = max(cpu_count, 2) if 'Uvicorn' in worker_class else cpu_count * 2 + 1
+workers = int(os.getenv('WEB_CONCURRENCY', str(min(default_workers, int(os.getenv('GUNICORN_MAX_WORKERS', '8'))))))
+threads = int(os.getenv('GUNICORN_THREADS', str(min(cpu_count * 2, 8))))
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', '5'))
+
+# Recycle workers every ~1000 requests; the jitter keeps them from restarting together.
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '1000'))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', str(max_requests // 10)))
+
+# Import Django once in the master so workers share its memory copy-on-write.
+preload_app = os.getenv('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+# ===== METRICS =====
+# Workers share /metrics through per-process files in this directory
+# (see website.metrics). It is emptied whenever the server starts.
+metrics_dir = os.environ.setdefault('METRICS_DIR', os.path.join(tempfile.gettempdir(), 'banquet-metrics'))
+
+# ===== LOGGING =====
+accesslog = os.getenv('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+# %(M)s is the request duration in milliseconds. Banquet.workers.UvicornWorker
+# writes the same fields itself, as uvicorn ignores this format.
+access_log_format = '%(h)s "%(r)s" %(s)s %(B)sB %(M)sms "%(a)s"'
+
+
+# ===== HOOKS =====
+def post_fork(server, worker):
+    # Connections must never be shared across a fork; preloading should not
+    # open any, but drop them just in case.
+    from django.db import connections
+
+    connections.close_all()
+
+
+def on_starting(server):
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+
+
+def child_exit(server, worker):
+    # Keep a recycled worker's counts, but in the shared archive file.
+    from website.metrics import merge_process
+
+    merge_process(metrics_dir, worker.pid)
@@ -10,7 +10,10 @@ document.addEventListener('DOMContentLoaded', function() {
     // Multiple image upload handling
     const imageInput = document.getElementById('id_image');
     const imagePreview = document.getElementById('image-preview');
-    const maxFiles = 5;
+    // Count and total size limits are rendered from the server settings
+    const limits = imageInput ? imageInput.dataset : {};
+    const maxFiles = parseInt(limits.maxFiles, 10) || 20;
+    const maxTotalSize = parseInt(limits.maxTotalBytes, 10) || 60 * 1024 * 1024;
     const maxFileSize = 5 * 1024 * 1024; // 5MB
 
     if (imageInput) {
@@ -53,6 +56,14 @@ document.addEventListener('DOMContentLoaded', function() {
             return;
         }
 
+        // Validate total size
+        const totalSize = Array.from(files).reduce((sum, file) => sum + file.size, 0);
+        if (totalSize > maxTotalSize) {
+            const limitMb = Math.floor(maxTotalSize / (1024 * 1024));
+            showError(`Images must total at most ${limitMb}MB.`);
+            return;
+        }
+
         Array.from(files).forEach((file, index) => {
             // Validate file size
             if (file.size > maxFileSize) {
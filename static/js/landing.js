@@ -4,8 +4,20 @@ document.addEventListener('DOMContentLoaded', () => {
     let currentSlide = 0;
     const slideInterval = 5000; // 5 seconds per slide
 
+    // Slides after the first carry data-src/data-srcset so they stay off the
+    // critical path; fill them in after load, or when shown if that is sooner.
+    function loadSlide(slide) {
+        slide.querySelectorAll('[data-srcset], [data-src]').forEach((el) => {
+            if (el.dataset.srcset) el.srcset = el.dataset.srcset;
+            if (el.dataset.src) el.src = el.dataset.src;
+            delete el.dataset.srcset;
+            delete el.dataset.src;
+        });
+    }
+
     function showSlide(index) {
         slides.forEach((slide, i) => {
+            if (i === index) loadSlide(slide);
             slide.classList.toggle('active', i === index);
         });
     }
@@ -18,35 +30,80 @@ document.addEventListener('DOMContentLoaded', () => {
     if (slides.length > 0) {
         showSlide(currentSlide);
         setInterval(nextSlide, slideInterval);
+        window.addEventListener('load', () => slides.forEach(loadSlide));
     }
 
-    // ===== SEARCH FORM =====
+    // ===== SEARCH FORM (JSON search API) =====
     const form = document.querySelector('.search-form');
-    if (form) {
-        form.addEventListener('submit', (e) => {
-            e.preventDefault();
-
-            const city = document.querySelector('.input-city').value.trim();
-            const date = document.querySelector('.input-date').value;
-            const guests = document.querySelector('.input-guests').value;
-            const eventType = document.querySelector('.input-event').value;
-            const budget = document.querySelector('.input-budget').value;
-
-            if (!city || !date || !guests || !eventType || !budget) {
-                alert("Please fill all fields before searching!");
-                return;
+    const resultBox = document.querySelector('.search-result');
+    if (form && resultBox && form.dataset.apiUrl) {
+        const grid = resultBox.querySelector('.banquet-grid');
+        const status = resultBox.querySelector('.search-status');
+        const loadMore = resultBox.querySelector('.load-more');
+        let params = null;
+
+        const renderCard = (banquet) => {
+            const card = document.createElement('div');
+            card.className = 'banquet-result-card';
+            if (banquet.cover) {
+                const img = document.createElement('img');
+                img.src = banquet.cover;
+                img.alt = banquet.banquet_name;
+                img.className = 'banquet-cover';
+                img.loading = 'lazy';
+                card.appendChild(img);
             }
+            const title = document.createElement('h3');
+            title.textContent = banquet.banquet_name;
+            const location = document.createElement('p');
+            location.textContent = `📍 ${banquet.location}`;
+            const capacity = document.createElement('p');
+            capacity.textContent = `👥 Up to ${banquet.capacity} guests`;
+            card.append(title, location, capacity);
+            if (banquet.price) {
+                const price = document.createElement('p');
+                price.textContent = `₹ ${Number(banquet.price).toLocaleString('en-IN')}`;
+                card.appendChild(price);
+            }
+            return card;
+        };
 
-            const resultBox = document.querySelector('.search-result');
-            const message = `🔍 Searching venues in ${city} for ${guests} guests on ${date} for a ${eventType} with budget ₹${budget}...`;
+        const fetchPage = async (cursor) => {
+            const query = new URLSearchParams(params);
+            if (cursor) query.set('cursor', cursor);
+            const response = await fetch(`${form.dataset.apiUrl}?${query}`, {
+                headers: { 'Accept': 'application/json' }
+            });
+            if (!response.ok) throw new Error(`Search failed (${response.status})`);
+            return response.json();
+        };
 
-            if (resultBox) {
-                resultBox.textContent = message;
-                resultBox.classList.add('visible');
-            } else {
-                alert(message);
+        const showPage = async (cursor) => {
+            try {
+                const data = await fetchPage(cursor);
+                data.results.forEach(banquet => grid.appendChild(renderCard(banquet)));
+                if (!grid.children.length) status.textContent = 'No banquets match your search yet.';
+                loadMore.hidden = !data.next_cursor;
+                loadMore.dataset.cursor = data.next_cursor || '';
+            } catch (err) {
+                status.textContent = 'Something went wrong. Please try again.';
             }
+        };
+
+        form.addEventListener('submit', (e) => {
+            e.preventDefault();
+            params = new URLSearchParams(new FormData(form));
+            grid.innerHTML = '';
+            status.textContent = `🔍 Searching venues in ${params.get('area')} for ${params.get('guests')} guests...`;
+            resultBox.hidden = false;
+            resultBox.classList.add('visible');
+            showPage(null).then(() => {
+                if (grid.children.length) status.textContent = '';
+            });
+            resultBox.scrollIntoView({ behavior: 'smooth', block: 'start' });
         });
+
+        loadMore.addEventListener('click', () => showPage(loadMore.dataset.cursor));
     }
 
     // ===== FADE-IN ON SCROLL (INTERSECTION OBSERVER) =====
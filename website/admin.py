@@ -1,35 +1,159 @@
+import datetime
+
 from django.contrib import admin
-from .models import Banquet, BanquetImage, ScheduleCall, ContactMessage
+from django.contrib.admin.views.main import PAGE_VAR
+from django.utils import timezone
+from .models import Banquet, BanquetBooking, BanquetImage, CallSlot, ScheduleCall, ContactMessage, LeadExportCursor
 from django.utils.html import mark_safe
+from .exports import export_filename, export_response, get_cursor, lead_queryset
+from .pagination import EstimatedCountPaginator
+from .tasks import enqueue_image_processing
+
+# ===== LARGE-TABLE CHANGELISTS =====
+class EstimatedCountAdmin(admin.ModelAdmin):
+    """Changelist paged without a full ``COUNT(*)`` (see EstimatedCountPaginator)."""
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        try:
+            page = int(request.GET.get(PAGE_VAR, 1))
+        except ValueError:
+            page = 1
+        return self.paginator(queryset, per_page, orphans, allow_empty_first_page, page_hint=page)
 
 # ===== BANQUET IMAGES INLINE =====
 class BanquetImageInline(admin.TabularInline):
     model = BanquetImage
     extra = 1
-    readonly_fields = ('image_tag',)  # shows image preview
+    readonly_fields = ('image_tag',)  # thumbnail preview, loaded lazily
     fields = ('image', 'image_tag')
 
+# ===== BANQUET BOOKINGS INLINE =====
+class BanquetBookingInline(admin.TabularInline):
+    model = BanquetBooking
+    extra = 0
+    fields = ('start_date', 'end_date', 'note')
+
 # ===== BANQUET ADMIN =====
 @admin.register(Banquet)
-class BanquetAdmin(admin.ModelAdmin):
+class BanquetAdmin(EstimatedCountAdmin):
     list_display = ('banquet_name', 'owner', 'owner_name', 'email', 'phone', 'capacity', 'location')
-    inlines = [BanquetImageInline]
+    list_select_related = ('owner',)
+    inlines = [BanquetImageInline, BanquetBookingInline]
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).for_listing(images=False)
+
+    def save_formset(self, request, form, formset, change):
+        super().save_formset(request, form, formset, change)
+        if formset.model is BanquetImage:
+            enqueue_image_processing(obj.id for obj in formset.new_objects)
 
 # ===== BANQUET IMAGE ADMIN =====
 @admin.register(BanquetImage)
-class BanquetImageAdmin(admin.ModelAdmin):
-    list_display = ('banquet', 'image_tag')
-    readonly_fields = ('image_tag',)
+class BanquetImageAdmin(EstimatedCountAdmin):
+    list_display = ('banquet', 'image_tag', 'status')
+    list_select_related = ('banquet',)
+    readonly_fields = ('image_tag', 'status')
+
+    def save_model(self, request, obj, form, change):
+        if 'image' in form.changed_data:
+            obj.status = BanquetImage.Status.PENDING
+        super().save_model(request, obj, form, change)
+        if 'image' in form.changed_data:
+            enqueue_image_processing([obj.id])
+
+# ===== LEAD ADMINS =====
+# Lead tables grow without bound: search only by indexed exact email/phone or
+# name prefix, never COUNT(*) the whole table, and drill down by created_at.
+class CreatedMonthFilter(admin.SimpleListFilter):
+    """Recent days/months as ``created_at`` ranges.
+
+    Stands in for ``date_hierarchy``, whose SELECT DISTINCT over truncated
+    timestamps reads every row; the choices here come from the calendar and
+    each one is a range scan on the created_at index.
+    """
+    title = 'created'
+    parameter_name = 'created'
+    months = 12
+
+    def lookups(self, request, model_admin):
+        today = timezone.localdate()
+        choices = [('7d', 'Past 7 days')]
+        year, month = today.year, today.month
+        for _ in range(self.months):
+            choices.append((f'{year}-{month:02d}', datetime.date(year, month, 1).strftime('%B %Y')))
+            year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+        return choices
+
+    def queryset(self, request, queryset):
+        value = self.value()
+        if value == '7d':
+            return queryset.filter(created_at__gte=timezone.now() - datetime.timedelta(days=7))
+        try:
+            year, month = map(int, (value or '').split('-'))
+            start = datetime.date(year, month, 1)
+        except ValueError:
+            return queryset
+        end = datetime.date(year + month // 12, month % 12 + 1, 1)
+        return queryset.filter(
+            created_at__gte=timezone.make_aware(datetime.datetime.combine(start, datetime.time.min)),
+            created_at__lt=timezone.make_aware(datetime.datetime.combine(end, datetime.time.min)),
+        )
+
+
+class LeadAdmin(EstimatedCountAdmin):
+    ordering = ('-created_at',)
+    search_help_text = 'Exact email or phone, or the start of the name.'
+    actions = ['export_csv', 'export_jsonl', 'export_new_csv']
+    export_key = None  # LEAD_MODELS key, also the default export cursor name
+
+    # Exports stream the selection (or, with "select all", the filtered
+    # changelist) in id order; see website.exports. The incremental export
+    # always covers the whole table: the cursor is shared, so advancing it
+    # past a partial selection would skip the leads that were left out.
+    def _export(self, request, queryset, fmt, cursor=None):
+        rows = lead_queryset(queryset, after_id=cursor.last_id if cursor else None)
+        return export_response(request, rows, fmt, export_filename(self.export_key, fmt), cursor)
+
+    @admin.action(description='Export selected leads as CSV')
+    def export_csv(self, request, queryset):
+        return self._export(request, queryset, 'csv')
+
+    @admin.action(description='Export selected leads as JSON Lines')
+    def export_jsonl(self, request, queryset):
+        return self._export(request, queryset, 'jsonl')
+
+    @admin.action(description='Export all leads added since the last export (CSV)')
+    def export_new_csv(self, request, queryset):
+        return self._export(request, self.model.objects.all(), 'csv', get_cursor(self.export_key))
+
 
 # ===== SCHEDULE CALL ADMIN =====
 @admin.register(ScheduleCall)
-class ScheduleCallAdmin(admin.ModelAdmin):
+class ScheduleCallAdmin(LeadAdmin):
+    export_key = 'schedule_calls'
     list_display = ('name', 'email', 'phone', 'date', 'time_slot', 'reason', 'created_at')
+    list_filter = (CreatedMonthFilter, 'date')
+    search_fields = ('=email', '=phone', '^name')
+
+# ===== CALL SLOT ADMIN =====
+@admin.register(CallSlot)
+class CallSlotAdmin(admin.ModelAdmin):
+    list_display = ('date', 'time_slot', 'booked', 'capacity')
     list_filter = ('date',)
-    search_fields = ('name', 'email', 'phone')
+    list_editable = ('capacity',)
 
 # ===== CONTACT MESSAGE ADMIN =====
 @admin.register(ContactMessage)
-class ContactMessageAdmin(admin.ModelAdmin):
+class ContactMessageAdmin(LeadAdmin):
+    export_key = 'contact_messages'
     list_display = ('full_name', 'email', 'phone', 'subject', 'created_at')
-    search_fields = ('full_name', 'email', 'subject')
+    list_filter = (CreatedMonthFilter,)
+    search_fields = ('=email', '=phone', '^full_name')
+
+# ===== LEAD EXPORT CURSOR ADMIN =====
+@admin.register(LeadExportCursor)
+class LeadExportCursorAdmin(admin.ModelAdmin):
+    list_display = ('name', 'last_id', 'updated_at')
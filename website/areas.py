@@ -0,0 +1,111 @@
+import math
+import re
+from collections import defaultdict
+from functools import lru_cache
+
+from .constants import KANPUR_AREAS
+
+# ===== AREA NORMALIZATION =====
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+CITY_KEY = 'kanpur'  # also an area name, but present in almost every address
+MIN_SIMILARITY = 0.62
+
+
+def normalize_area(value):
+    """Fold an area name to the key stored in ``Banquet.location_key``.
+
+    Case, punctuation and repeated whitespace are dropped so that
+    "Kanpur Cantt." and "kanpur  cantt" share one indexed key.
+    """
+    if not value:
+        return ''
+    return _NON_ALNUM.sub(' ', value.casefold()).strip()
+
+
+def _trigrams(key):
+    padded = f'  {key} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# ===== AREA INDEX =====
+class AreaIndex:
+    """Precomputed lookup tables resolving free text to a canonical area.
+
+    Tried in order: exact normalized key, key without spaces ("barra2"),
+    an area named inside a longer address ("12 Mall Rd, Barra 2") and finally
+    trigram (Dice) similarity for typos ("Birhana Road" -> "Birhana Raod").
+    Trigrams are IDF-weighted so shared filler such as " nagar" cannot on its
+    own make "Ram Nagar" resolve to "Shyam Nagar".
+    """
+
+    def __init__(self, areas):
+        self.areas = list(areas)
+        self.by_key = {}
+        self.by_compact = {}
+        self.postings = defaultdict(list)
+        area_grams = []
+        for i, area in enumerate(self.areas):
+            key = normalize_area(area)
+            self.by_key.setdefault(key, area)
+            self.by_compact.setdefault(key.replace(' ', ''), area)
+            area_grams.append(_trigrams(key))
+            for gram in area_grams[-1]:
+                self.postings[gram].append(i)
+
+        count = len(self.areas) + 1
+        self.unseen_weight = math.log(count) + 1
+        self.weights = {gram: math.log(count / (len(ids) + 1)) + 1 for gram, ids in self.postings.items()}
+        self.postings = dict(self.postings)
+        self.mass = [sum(self.weights[g] for g in grams) for grams in area_grams]
+        self.max_words = max((len(k.split()) for k in self.by_key), default=1)
+
+    def _contained(self, key):
+        words = key.split()
+        matches = []
+        for size in range(min(self.max_words, len(words)), 0, -1):
+            for start in range(len(words) - size + 1):
+                area = self.by_key.get(' '.join(words[start:start + size]))
+                if area:
+                    matches.append((normalize_area(area) == CITY_KEY, -size, start, area))
+        return min(matches)[3] if matches else None
+
+    def _similar(self, key):
+        grams = _trigrams(key)
+        shared = defaultdict(float)
+        mass = 0.0
+        for gram in grams:
+            mass += self.weights.get(gram, self.unseen_weight)
+            for i in self.postings.get(gram, ()):
+                shared[i] += self.weights[gram]
+        best, best_score = None, MIN_SIMILARITY
+        for i, overlap in shared.items():
+            score = 2 * overlap / (mass + self.mass[i])
+            if score > best_score:
+                best, best_score = self.areas[i], score
+        return best
+
+    def resolve(self, text):
+        key = normalize_area(text)
+        if not key:
+            return None
+        return (
+            self.by_key.get(key)
+            or self.by_compact.get(key.replace(' ', ''))
+            or self._contained(key)
+            or self._similar(key)
+        )
+
+
+AREA_INDEX = AreaIndex(KANPUR_AREAS)
+
+
+@lru_cache(maxsize=4096)
+def resolve_area(text):
+    """Canonical ``KANPUR_AREAS`` entry for user input, or None."""
+    return AREA_INDEX.resolve(text)
+
+
+def area_key(text):
+    """Indexed search key: the resolved area's key, else the normalized text."""
+    return normalize_area(resolve_area(text) or text)
@@ -0,0 +1,194 @@
+import re
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.utils.text import slugify
+from PIL import Image, ImageOps, features
+
+# ===== BUNDLES =====
+# Per-page CSS/JS, in the order the page loads them. ``build_assets`` writes
+# each list to ``static/dist/<page>.<kind>``; the ``{% bundle %}`` tag links
+# either that file or the sources (see ASSET_BUNDLES in settings).
+BUNDLES = {
+    'landing': {
+        'css': ['css/landing.css', 'css/banquet-cards.css', 'css/landing-page.css'],
+        'js': ['js/landing.js'],
+    },
+    'banquet': {
+        'css': ['css/banquet.css', 'css/banquet-cards.css'],
+        'js': ['js/banquet.js'],
+    },
+    'about': {
+        'css': ['css/about.css', 'css/landing.css'],
+        'js': ['js/about.js'],
+    },
+    'contact': {
+        'css': ['css/landing.css', 'css/contact.css'],
+        'js': ['js/form-utils.js', 'js/contact.js'],
+    },
+    'login': {
+        'css': ['css/login.css', 'css/landing.css'],
+        'js': ['js/form-utils.js', 'js/login.js'],
+    },
+    'register': {
+        'css': ['css/register.css', 'css/landing.css'],
+        'js': ['js/form-utils.js', 'js/banquet-register.js'],
+    },
+    'schedule-call': {
+        'css': ['css/landing.css', 'css/schedule-call.css'],
+        'js': ['js/form-utils.js', 'js/schedule-call.js'],
+    },
+    'signup': {
+        'css': ['css/landing.css', 'css/signup.css'],
+        'js': ['js/form-utils.js', 'js/signup.js'],
+    },
+}
+
+BUNDLE_DIR = 'dist'
+
+
+def bundle_path(page, kind):
+    return f'{BUNDLE_DIR}/{page}.{kind}'
+
+
+# ===== CSS =====
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_IMPORT = re.compile(r'@import\s*(?:url\([^)]*\)|\'[^\']*\'|"[^"]*")[^;]*;')
+
+
+def minify_css(source):
+    source = _CSS_COMMENT.sub('', source)
+    source = re.sub(r'\s+', ' ', source)
+    source = re.sub(r'\s*([{};,>])\s*', r'\1', source)
+    source = re.sub(r':\s+', ':', source)
+    return source.replace(';}', '}').strip()
+
+
+def bundle_css(sources):
+    """Concatenate and minify stylesheets; ``@import`` rules are hoisted to the top."""
+    body = '\n'.join(minify_css(text) for text in sources)
+    imports = _CSS_IMPORT.findall(body)
+    return ''.join(imports) + _CSS_IMPORT.sub('', body)
+
+
+# ===== JS =====
+_REGEX_AFTER = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_AFTER_WORDS = re.compile(r'\b(return|typeof|case|do|else|in|of|void|yield|await)$')
+
+
+def _compact(code):
+    code = re.sub(r'[ \t]*\n\s*', '\n', code)
+    return re.sub(r'[ \t]+', ' ', code)
+
+
+def minify_js(source):
+    """Drop comments and indentation, keeping line breaks so ASI is unaffected.
+
+    Strings, template literals and regex literals are copied verbatim.
+    """
+    out, code = [], []
+    i, n = 0, len(source)
+
+    def flush():
+        out.append(_compact(''.join(code)))
+        code.clear()
+
+    while i < n:
+        c = source[i]
+        if source.startswith('//', i):
+            i = source.find('\n', i)
+            i = n if i == -1 else i
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+            code.append(' ')
+        elif c in '"\'`' or (c == '/' and _starts_regex(''.join(out) + ''.join(code))):
+            j, in_class = i + 1, False
+            while j < n:
+                ch = source[j]
+                if ch == '\\':
+                    j += 2
+                    continue
+                if c == '/' and ch == '[':
+                    in_class = True
+                elif c == '/' and ch == ']':
+                    in_class = False
+                elif ch == c and not in_class:
+                    break
+                j += 1
+            j += 1
+            if c == '/':
+                while j < n and source[j].isalpha():  # flags
+                    j += 1
+            flush()
+            out.append(source[i:j])
+            i = j
+        else:
+            code.append(c)
+            i += 1
+    flush()
+    return ''.join(out).strip()
+
+
+def _starts_regex(before):
+    before = before.rstrip()
+    return not before or before[-1] in _REGEX_AFTER or bool(_REGEX_AFTER_WORDS.search(before))
+
+
+def bundle_js(sources):
+    # Scripts are joined with ';' so a file missing its final semicolon cannot merge into the next.
+    scripts = [minify_js(text) for text in sources if text.strip()]
+    return ';\n'.join(scripts) + ';\n' if scripts else ''
+
+
+# ===== RESPONSIVE IMAGES =====
+# Every file under static/images/ is re-encoded at these widths (never
+# upscaled) in each available format; ``{% picture %}`` emits the srcsets.
+# What was built is recorded in IMAGE_MANIFEST, so the tag neither opens
+# images nor assumes the serving host's codecs match the build host's.
+IMAGE_SOURCE_DIR = 'images'
+IMAGE_MANIFEST = f'{BUNDLE_DIR}/images.json'
+RESPONSIVE_WIDTHS = (480, 960, 1600)
+RESPONSIVE_FORMATS = [
+    (ext, fmt, options)
+    for ext, fmt, options in (
+        ('avif', 'AVIF', {'quality': 50}),
+        ('webp', 'WEBP', {'quality': 75}),
+        ('jpg', 'JPEG', {'quality': 80, 'optimize': True, 'progressive': True}),
+    )
+    if ext == 'jpg' or features.check(ext)
+]
+
+
+def image_widths(width):
+    return [w for w in RESPONSIVE_WIDTHS if w < width] + [min(width, RESPONSIVE_WIDTHS[-1])]
+
+
+def image_variant_path(path, width, ext):
+    stem = slugify(PurePosixPath(path).stem)
+    return f'{BUNDLE_DIR}/images/{stem}-{width}.{ext}'
+
+
+def image_record(file):
+    """IMAGE_MANIFEST entry for one source image: displayed size, widths and formats."""
+    with Image.open(file) as image:
+        width, height = ImageOps.exif_transpose(image).size
+    return {
+        'width': width,
+        'height': height,
+        'widths': image_widths(width),
+        'formats': [ext for ext, _, _ in RESPONSIVE_FORMATS],
+    }
+
+
+def build_image_variants(path, file):
+    """Yield ``(variant path, encoded bytes)`` for every width/format of one image."""
+    with Image.open(file) as source:
+        source = ImageOps.exif_transpose(source).convert('RGB')
+    for width in image_widths(source.width):
+        height = round(source.height * width / source.width)
+        resized = source.resize((width, height), Image.Resampling.LANCZOS) if width != source.width else source
+        for ext, fmt, options in RESPONSIVE_FORMATS:
+            buffer = BytesIO()
+            resized.save(buffer, fmt, **options)
+            yield image_variant_path(path, width, ext), buffer.getvalue()
@@ -0,0 +1,65 @@
+import calendar
+import datetime
+
+from django.apps import apps
+from django.db.models import Exists, OuterRef
+from django.utils.dateparse import parse_date
+
+
+# ===== SEARCH FILTER =====
+def available_on(queryset, day):
+    """Banquets with no booking covering ``day`` (a date or ISO string).
+
+    Each banquet is checked with a NOT EXISTS seek on the
+    (banquet, start_date, end_date) booking index.
+    """
+    if isinstance(day, str):
+        try:
+            day = parse_date(day)
+        except ValueError:
+            day = None
+    if not day:
+        return queryset
+    BanquetBooking = apps.get_model('website', 'BanquetBooking')
+    clash = BanquetBooking.objects.filter(banquet=OuterRef('pk'), start_date__lte=day, end_date__gte=day)
+    return queryset.filter(~Exists(clash))
+
+
+# ===== MONTH BITMAPS =====
+def year_bitmap(ranges, year):
+    """Twelve ints for ``year``; bit ``d - 1`` of month ``m`` is set when day d is booked."""
+    months = [0] * 12
+    first, last = datetime.date(year, 1, 1), datetime.date(year, 12, 31)
+    for start, end in ranges:
+        day, end = max(start, first), min(end, last)
+        while day <= end:
+            months[day.month - 1] |= 1 << (day.day - 1)
+            day += datetime.timedelta(days=1)
+    return months
+
+
+def booked_days(bitmap, year):
+    """Expand a year bitmap into ``{month: [day, ...]}`` for calendar rendering."""
+    return {
+        month: [d for d in range(1, calendar.monthrange(year, month)[1] + 1) if bits >> (d - 1) & 1]
+        for month, bits in enumerate(bitmap, start=1)
+    }
+
+
+def rebuild_calendar(banquet_id, years):
+    """Recompute the BanquetCalendar rows of one banquet for ``years``."""
+    BanquetBooking = apps.get_model('website', 'BanquetBooking')
+    BanquetCalendar = apps.get_model('website', 'BanquetCalendar')
+    for year in set(years):
+        ranges = BanquetBooking.objects.filter(
+            banquet_id=banquet_id,
+            start_date__lte=datetime.date(year, 12, 31),
+            end_date__gte=datetime.date(year, 1, 1),
+        ).values_list('start_date', 'end_date')
+        BanquetCalendar.objects.update_or_create(
+            banquet_id=banquet_id, year=year, defaults={'booked': year_bitmap(ranges, year)},
+        )
+
+
+def booking_years(start, end):
+    return range(start.year, end.year + 1)
@@ -0,0 +1,118 @@
+import hashlib
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.core.exceptions import BadRequest
+
+from .metrics import LISTING_CACHE, listing_cache_counts
+from .search import search_params
+
+LISTING_VERSION_KEY = 'listing:version'
+
+
+# ===== INVALIDATION =====
+# The version is a fresh token rather than a counter: if the key is ever
+# culled, the next read starts a namespace no cached page can be in, instead
+# of restarting at a number older pages were stored under.
+def _new_version():
+    return time.time_ns()
+
+
+def listing_version():
+    return cache.get_or_set(LISTING_VERSION_KEY, _new_version, timeout=None)
+
+
+def bump_listing_version():
+    """Invalidate every cached listing page by moving to a new key namespace."""
+    cache.set(LISTING_VERSION_KEY, _new_version(), timeout=None)
+
+
+# ===== HIT / MISS COUNTERS =====
+def cache_stats():
+    """Listing cache hits and misses of every worker, from ``website.metrics``."""
+    hits, misses = listing_cache_counts()
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 4) if total else 0.0,
+        'version': listing_version(),
+    }
+
+
+# ===== VIEW CACHE =====
+def _normalized_params(request):
+    params = search_params(request)
+    params['ajax'] = request.headers.get('X-Requested-With') == 'XMLHttpRequest'
+    return params
+
+
+def _cache_key(view_name, request):
+    params = sorted(_normalized_params(request).items())
+    digest = hashlib.md5(repr(params).encode()).hexdigest()
+    return f'view:{view_name}:{listing_version()}:{digest}'
+
+
+def _is_cacheable(request):
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    if request.user.is_authenticated:
+        return False  # owners always see their edits
+    return not len(get_messages(request))
+
+
+def _cached_response(view_name, request):
+    """Return ``(key, response)``; ``key`` is None when the request bypasses the cache."""
+    if not _is_cacheable(request):
+        return None, None
+    try:
+        key = _cache_key(view_name, request)
+    except BadRequest:
+        return None, None  # a view that reads the filters answers 400
+    response = cache.get(key)
+    LISTING_CACHE.inc(result='hit' if response is not None else 'miss')
+    return key, response
+
+
+def _store(key, response):
+    if response.status_code == 200 and not response.cookies and not response.streaming:
+        cache.set(key, response, settings.VIEW_CACHE_TIMEOUT)
+
+
+def cache_listing_view(view_func):
+    """Cache anonymous responses keyed by view and normalized ``area``/``guests``.
+
+    Entries are dropped wholesale by :func:`bump_listing_version` whenever a
+    Banquet or BanquetImage changes (see ``website.signals``). Works on sync
+    and async views; for the latter the session/cache lookups run in a thread.
+    """
+    view_name = view_func.__name__
+
+    if iscoroutinefunction(view_func):
+        @wraps(view_func)
+        async def async_wrapper(request, *args, **kwargs):
+            key, response = await sync_to_async(_cached_response)(view_name, request)
+            if response is not None:
+                return response
+            response = await view_func(request, *args, **kwargs)
+            if key:
+                await sync_to_async(_store)(key, response)
+            return response
+
+        return async_wrapper
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        key, response = _cached_response(view_name, request)
+        if response is not None:
+            return response
+        response = view_func(request, *args, **kwargs)
+        if key:
+            _store(key, response)
+        return response
+
+    return wrapper
@@ -172,3 +172,12 @@ KANPUR_AREAS = KANPUR_AREAS = [
     "Vijai Nagar",
     "Yashoda Nagar",
 ]
+
+# Capacity histogram buckets for the area facets: (upper bound, AreaFacet field)
+CAPACITY_BUCKETS = [
+    (100, 'capacity_0_100'),
+    (300, 'capacity_101_300'),
+    (500, 'capacity_301_500'),
+    (1000, 'capacity_501_1000'),
+    (None, 'capacity_over_1000'),
+]
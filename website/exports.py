@@ -0,0 +1,107 @@
+import csv
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from .models import ContactMessage, LeadExportCursor, ScheduleCall
+
+EXPORT_CHUNK_SIZE = 2000  # rows per database fetch and per streamed chunk
+
+LEAD_MODELS = {
+    'schedule_calls': ScheduleCall,
+    'contact_messages': ContactMessage,
+}
+CONTENT_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'jsonl': 'application/x-ndjson',
+}
+
+
+def export_fields(model):
+    return [field.attname for field in model._meta.concrete_fields]  # primary key first
+
+
+def lead_queryset(queryset, since=None, until=None, after_id=None):
+    """Rows as ``values_list`` tuples in id order, optionally bounded by ``created_at`` and id."""
+    if since:
+        queryset = queryset.filter(created_at__gte=since)
+    if until:
+        queryset = queryset.filter(created_at__lt=until)
+    if after_id:
+        queryset = queryset.filter(id__gt=after_id)
+    return queryset.order_by('id').values_list(*export_fields(queryset.model))
+
+
+# ===== ENCODING =====
+class _Echo:
+    """File-like object whose ``write`` hands the line back to csv.writer's caller."""
+
+    def write(self, value):
+        return value
+
+
+def _encoder(fmt, fields):
+    if fmt == 'csv':
+        writer = csv.writer(_Echo())
+        return writer.writerow(fields), writer.writerow
+    return '', lambda row: json.dumps(dict(zip(fields, row)), cls=DjangoJSONEncoder) + '\n'
+
+
+def stream_leads(rows, fmt, cursor=None):
+    """Yield encoded chunks of ``rows`` using ``iterator(chunk_size=...)``.
+
+    Memory stays at one chunk however many rows there are. ``cursor`` is
+    advanced to the last id only once the stream has been fully consumed.
+    """
+    header, encode = _encoder(fmt, export_fields(rows.model))
+    chunk, last_id = [header], None
+    for row in rows.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        chunk.append(encode(row))
+        last_id = row[0]
+        if len(chunk) >= EXPORT_CHUNK_SIZE:
+            yield ''.join(chunk)
+            chunk.clear()
+    if chunk:
+        yield ''.join(chunk)
+    if cursor is not None and last_id is not None:
+        cursor.advance(last_id)
+
+
+async def astream_leads(rows, fmt, cursor=None):
+    """Async :func:`stream_leads` for ASGI responses.
+
+    Each chunk is produced in the thread-sensitive executor, so the query
+    and the cursor update keep using the same database connection.
+    (``aiterator()`` cannot be used: on ``values_list`` querysets it runs
+    the query on the event loop.)
+    """
+    chunks = stream_leads(rows, fmt, cursor)
+    while (chunk := await sync_to_async(next)(chunks, None)) is not None:
+        yield chunk
+
+
+def export_response(request, rows, fmt, filename, cursor=None):
+    """StreamingHttpResponse of ``rows``.
+
+    Under ASGI the body must be an async iterator; Django would otherwise
+    buffer a sync iterator in full before sending it.
+    """
+    if isinstance(request, ASGIRequest):
+        content = astream_leads(rows, fmt, cursor)
+    else:
+        content = stream_leads(rows, fmt, cursor)
+    response = StreamingHttpResponse(content, content_type=CONTENT_TYPES[fmt])
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+def export_filename(key, fmt):
+    return f'{key}-{timezone.now():%Y%m%d-%H%M%S}.{fmt}'
+
+
+def get_cursor(name):
+    return LeadExportCursor.objects.get_or_create(name=name)[0]
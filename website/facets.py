@@ -0,0 +1,79 @@
+from django.apps import apps
+from django.db.models import Count, F, Q
+
+from .constants import CAPACITY_BUCKETS, KANPUR_AREAS
+from .areas import normalize_area
+
+
+def capacity_bucket(capacity):
+    for upper, field in CAPACITY_BUCKETS:
+        if upper is None or capacity <= upper:
+            return field
+
+
+# ===== INCREMENTAL UPDATES =====
+def _apply(area_key, capacity, delta):
+    AreaFacet = apps.get_model('website', 'AreaFacet')
+    bucket = capacity_bucket(capacity)
+    AreaFacet.objects.get_or_create(area_key=area_key)
+    AreaFacet.objects.filter(area_key=area_key).update(
+        venue_count=F('venue_count') + delta,
+        **{bucket: F(bucket) + delta},
+    )
+
+
+def ensure_facet_state(banquet):
+    """Snapshot the stored (area, capacity) of a banquet loaded with deferred fields."""
+    if banquet._state.adding or getattr(banquet, '_facet_state', None) is not None:
+        return
+    banquet._facet_state = type(banquet).objects.filter(pk=banquet.pk).values_list(
+        'location_key', 'capacity',
+    ).first()
+
+
+def record_banquet_saved(banquet, created):
+    """Move the banquet's count from its stored (area, bucket) to the current one."""
+    old = None if created else getattr(banquet, '_facet_state', None)
+    new = (banquet.location_key, banquet.capacity)
+    if old is None or (old[0], capacity_bucket(old[1])) != (new[0], capacity_bucket(new[1])):
+        if old is not None:
+            _apply(old[0], old[1], -1)
+        _apply(new[0], new[1], 1)
+    banquet._facet_state = new
+
+
+def record_banquet_deleted(banquet):
+    old = getattr(banquet, '_facet_state', None)
+    if old is not None:
+        _apply(old[0], old[1], -1)
+
+
+# ===== FULL REBUILD =====
+def rebuild_facets(banquet_model=None, facet_model=None):
+    """Recompute every facet row from ``Banquet`` in one aggregate query."""
+    Banquet = banquet_model or apps.get_model('website', 'Banquet')
+    AreaFacet = facet_model or apps.get_model('website', 'AreaFacet')
+
+    buckets = {}
+    lower = 0
+    for upper, field in CAPACITY_BUCKETS:
+        condition = Q(capacity__gt=lower) if lower else Q()
+        if upper is not None:
+            condition &= Q(capacity__lte=upper)
+        buckets[field] = Count('id', filter=condition)
+        lower = upper
+
+    rows = Banquet.objects.values('location_key').annotate(venue_count=Count('id'), **buckets)
+    AreaFacet.objects.all().delete()
+    AreaFacet.objects.bulk_create(
+        [AreaFacet(area_key=row.pop('location_key'), **row) for row in rows],
+        batch_size=500,
+    )
+
+
+# ===== READ PATH =====
+def area_options():
+    """``(area, venue_count)`` for every KANPUR_AREAS entry, from one query."""
+    AreaFacet = apps.get_model('website', 'AreaFacet')
+    counts = dict(AreaFacet.objects.filter(venue_count__gt=0).values_list('area_key', 'venue_count'))
+    return [(area, counts.get(normalize_area(area), 0)) for area in KANPUR_AREAS]
@@ -1,4 +1,6 @@
 from django import forms
+from django.conf import settings
+from django.template.defaultfilters import filesizeformat
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
 from django.contrib.auth.models import User
 from .models import Banquet, BanquetImage, ScheduleCall, ContactMessage
@@ -62,16 +64,28 @@ class LoginForm(AuthenticationForm):
 class BanquetForm(forms.ModelForm):
     class Meta:
         model = Banquet
-        fields = ['banquet_name', 'email', 'phone', 'capacity', 'location', 'google_link']
+        fields = ['banquet_name', 'email', 'phone', 'capacity', 'price', 'location', 'google_link']
         widgets = {
             'banquet_name': forms.TextInput(attrs={'class': 'form-input', 'placeholder': 'Banquet Name'}),
             'email': forms.EmailInput(attrs={'class': 'form-input', 'placeholder': 'Email'}),
             'phone': forms.TextInput(attrs={'class': 'form-input', 'placeholder': 'Phone'}),
             'capacity': forms.NumberInput(attrs={'class': 'form-input', 'placeholder': 'Capacity'}),
+            'price': forms.NumberInput(attrs={'class': 'form-input', 'placeholder': 'Price (INR)'}),
             'location': forms.TextInput(attrs={'class': 'form-input', 'placeholder': 'Location'}),
             'google_link': forms.URLInput(attrs={'class': 'form-input', 'placeholder': 'Google My Business Page Link'}),
         }
 
+    def clean(self):
+        cleaned_data = super().clean()
+        images = self.files.getlist('image') if self.files else []
+        if len(images) > settings.BANQUET_MAX_IMAGES:
+            raise forms.ValidationError(f"You can upload at most {settings.BANQUET_MAX_IMAGES} images.")
+        if sum(f.size for f in images) > settings.BANQUET_MAX_UPLOAD_BYTES:
+            raise forms.ValidationError(
+                f"Images must total at most {filesizeformat(settings.BANQUET_MAX_UPLOAD_BYTES)}."
+            )
+        return cleaned_data
+
 
 # ===== SCHEDULE CALL FORM =====
 REASON_CHOICES = [
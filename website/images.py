@@ -0,0 +1,70 @@
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, features
+
+# ===== VARIANT SIZES =====
+# field name -> (width, height, crop). Cropped variants are filled to the exact
+# box; the hero keeps its aspect ratio and is only bounded by the box.
+IMAGE_VARIANTS = {
+    'thumbnail': (150, 100, True),
+    'card_image': (480, 320, True),
+    'hero_image': (1600, 900, False),
+}
+
+if features.check('webp'):
+    VARIANT_FORMAT, VARIANT_EXT = 'WEBP', 'webp'
+else:
+    VARIANT_FORMAT, VARIANT_EXT = 'JPEG', 'jpg'
+
+
+def _render(image, width, height, crop):
+    if crop:
+        return ImageOps.fit(image, (width, height), Image.Resampling.LANCZOS)
+    resized = image.copy()
+    resized.thumbnail((width, height), Image.Resampling.LANCZOS)
+    return resized
+
+
+def _encode(image, fmt, **options):
+    buffer = BytesIO()
+    image.save(buffer, fmt, **options)
+    return ContentFile(buffer.getvalue())
+
+
+def generate_variants(banquet_image, strip_original=False):
+    """Write the thumbnail, card and hero derivatives of ``banquet_image``.
+
+    Each variant is re-encoded without EXIF data and stored under
+    ``banquet_images/variants/``. With ``strip_original`` the uploaded file
+    is also replaced by an upright JPEG copy carrying no metadata (GPS,
+    camera serials), so the source is decoded only once per upload.
+    """
+    banquet_image.image.open('rb')
+    try:
+        with Image.open(banquet_image.image) as source:
+            source = ImageOps.exif_transpose(source)
+            source = source.convert('RGB')
+    finally:
+        banquet_image.image.close()
+
+    stem = os.path.splitext(os.path.basename(banquet_image.image.name))[0]
+    update_fields = list(IMAGE_VARIANTS)
+    for field, (width, height, crop) in IMAGE_VARIANTS.items():
+        variant = getattr(banquet_image, field)
+        if variant:
+            variant.delete(save=False)  # reprocessing replaces, never orphans
+        variant.save(
+            f'{stem}_{width}w.{VARIANT_EXT}',
+            _encode(_render(source, width, height, crop), VARIANT_FORMAT, quality=80, optimize=True),
+            save=False,
+        )
+
+    if strip_original:
+        old_name = banquet_image.image.name
+        banquet_image.image.save(f'{stem}.jpg', _encode(source, 'JPEG', quality=90, optimize=True), save=False)
+        banquet_image.image.storage.delete(old_name)
+        update_fields.append('image')
+
+    banquet_image.save(update_fields=update_fields)
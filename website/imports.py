@@ -0,0 +1,97 @@
+import csv
+import json
+
+from .areas import area_key, resolve_area
+from .forms import BanquetForm
+from .models import Banquet
+
+IMPORT_BATCH_SIZE = 500  # rows per INSERT ... ON CONFLICT statement
+REF_MAX_LENGTH = Banquet._meta.get_field('external_ref').max_length
+
+# Columns written by an upsert; owner and external_ref are the conflict key.
+UPSERT_FIELDS = [*BanquetForm.Meta.fields, 'owner_name', 'location_key']
+
+
+# ===== READING =====
+def read_rows(file, fmt):
+    """Yield ``(line number, dict)`` from an open CSV or JSON Lines file, one row at a time."""
+    if fmt == 'csv':
+        reader = csv.DictReader(file)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for line_no, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield line_no, {'__error__': f"Invalid JSON: {e}"}
+            continue
+        yield line_no, row if isinstance(row, dict) else {'__error__': "Expected a JSON object"}
+
+
+# ===== VALIDATION =====
+class RowValidator:
+    """Validate import rows with ``BanquetForm``, so imports follow the same
+    rules as ``register_banquet``; ``location`` is then replaced by its
+    canonical ``KANPUR_AREAS`` spelling.
+    """
+
+    def __init__(self, owner, allow_unknown_areas=False):
+        self.owner = owner
+        self.owner_name = owner.get_full_name() or owner.username
+        self.allow_unknown_areas = allow_unknown_areas
+
+    def clean(self, row):
+        """Return ``(banquet, None)`` for a valid row or ``(None, errors)``."""
+        if '__error__' in row:
+            return None, {'__all__': [row['__error__']]}
+        ref = str(row.get('external_ref') or '').strip()
+        if not ref:
+            return None, {'external_ref': ["This field is required."]}
+        if len(ref) > REF_MAX_LENGTH:
+            return None, {'external_ref': [f"Ensure this value has at most {REF_MAX_LENGTH} characters (it has {len(ref)})."]}
+
+        form = BanquetForm(data={field: row.get(field) for field in BanquetForm.Meta.fields})
+        if not form.is_valid():
+            return None, form.errors.get_json_data(escape_html=False)
+
+        banquet = form.instance
+        area = resolve_area(banquet.location)
+        if area:
+            banquet.location = area
+        elif not self.allow_unknown_areas:
+            return None, {'location': [f"Unknown area: {banquet.location!r}"]}
+
+        # bulk_create skips save(), so fill in what it would have set
+        banquet.owner = self.owner
+        banquet.owner_name = self.owner_name
+        banquet.location_key = area_key(banquet.location)
+        banquet.external_ref = ref
+        return banquet, None
+
+
+def error_text(errors):
+    return '; '.join(
+        f"{field}: {' '.join(e['message'] if isinstance(e, dict) else e for e in messages)}"
+        for field, messages in errors.items()
+    )
+
+
+# ===== WRITING =====
+def upsert_banquets(banquets):
+    """Insert or update ``banquets`` on (owner, external_ref) in one statement.
+
+    The last row wins when a batch repeats a ref (an upsert may not touch
+    the same row twice). Signals do not fire, so callers rebuild the area
+    facets and bump the listing cache afterwards.
+    """
+    unique = list({(b.owner_id, b.external_ref): b for b in banquets}.values())
+    Banquet.objects.bulk_create(
+        unique,
+        update_conflicts=True,
+        unique_fields=['owner', 'external_ref'],
+        update_fields=UPSERT_FIELDS,
+    )
+    return len(unique)
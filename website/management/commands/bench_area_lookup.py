@@ -0,0 +1,51 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from website.areas import AREA_INDEX, resolve_area
+from website.constants import KANPUR_AREAS
+
+SAMPLE_INPUTS = [
+    'barra', 'Barra 2', 'BARRA-2', 'Birhana Road', 'kidwai ngr', 'Kanpur Cantt',
+    '12 Mall Road, Swarup Nagar, Kanpur', 'govind nagar west', 'Kalyanpur Kanpur',
+    'Sarvodya Nagar', 'Panki Gangaganj', 'Tatyaganj', 'somewhere else entirely',
+]
+
+
+class Command(BaseCommand):
+    help = "Benchmark area resolution latency (cold index lookups and cached calls)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20000)
+
+    def _report(self, label, timings):
+        timings.sort()
+        mean = sum(timings) / len(timings)
+        p99 = timings[int(len(timings) * 0.99) - 1]
+        self.stdout.write(f"{label:<22} mean {mean * 1e6:7.2f} µs   p99 {p99 * 1e6:7.2f} µs   max {timings[-1] * 1e6:7.2f} µs")
+
+    def handle(self, *args, **options):
+        rng = random.Random(42)
+        inputs = SAMPLE_INPUTS + [area.lower() for area in KANPUR_AREAS]
+        iterations = options['iterations']
+
+        for text in SAMPLE_INPUTS:
+            self.stdout.write(f"{text!r:<40} -> {AREA_INDEX.resolve(text)!r}")
+
+        uncached = []
+        for _ in range(iterations):
+            text = rng.choice(inputs)
+            start = time.perf_counter()
+            AREA_INDEX.resolve(text)
+            uncached.append(time.perf_counter() - start)
+
+        cached = []
+        for _ in range(iterations):
+            text = rng.choice(inputs)
+            start = time.perf_counter()
+            resolve_area(text)
+            cached.append(time.perf_counter() - start)
+
+        self._report('index (uncached)', uncached)
+        self._report('resolve_area (cached)', cached)
@@ -0,0 +1,66 @@
+import random
+import time
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from website.areas import normalize_area
+from website.constants import KANPUR_AREAS
+from website.models import Banquet
+from website.search import search_banquets
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark budget filtering against synthetic listings. Rows are inserted "
+        "inside a transaction that is rolled back, so the database is left unchanged."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100000)
+        parser.add_argument('--repeat', type=int, default=200)
+
+    def _time(self, run, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        return sum(timings) / len(timings) * 1000, timings[int(len(timings) * 0.99) - 1] * 1000
+
+    def handle(self, *args, **options):
+        rng = random.Random(7)
+        rows, repeat = options['rows'], options['repeat']
+
+        with transaction.atomic():
+            owner = User.objects.create(username='__bench_price_filter__')
+            areas = [normalize_area(a) for a in KANPUR_AREAS]
+            start = time.perf_counter()
+            Banquet.objects.bulk_create(
+                (
+                    Banquet(
+                        owner=owner, owner_name='Bench', banquet_name=f'Bench Hall {i}',
+                        email='bench@example.com', phone='0', capacity=rng.randrange(50, 3000, 50),
+                        price=Decimal(rng.randrange(10000, 2000000, 500)), location=area, location_key=area,
+                    )
+                    for i, area in ((i, rng.choice(areas)) for i in range(rows))
+                ),
+                batch_size=2000,
+            )
+            self.stdout.write(f"Inserted {rows} synthetic listings in {time.perf_counter() - start:.1f}s")
+
+            base = Banquet.objects.all()
+            cases = {
+                'budget range (ids)': lambda: search_banquets(base, min_budget=200000, max_budget=250000).values('id'),
+                'area + max budget': lambda: search_banquets(base, area='Barra', max_budget=300000).values('id'),
+            }
+            for label, factory in cases.items():
+                queryset = factory()
+                self.stdout.write(f"\n{label}:\n  {queryset.explain()}")
+                mean, p99 = self._time(lambda: list(factory()[:50]), repeat)
+                self.stdout.write(f"  mean {mean:.3f} ms   p99 {p99:.3f} ms   ({connection.vendor})")
+
+            transaction.set_rollback(True)
@@ -0,0 +1,96 @@
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection, connections
+from django.test import Client
+from django.urls import reverse
+
+from website.models import ContactMessage
+
+BENCH_EMAIL = 'bench-concurrency@example.com'
+
+
+class Command(BaseCommand):
+    help = (
+        "Mix landing-page reads with contact-form writes from several threads and "
+        "report throughput and lock errors. Messages written by the run are deleted afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--readers', type=int, default=8)
+        parser.add_argument('--writers', type=int, default=2)
+        parser.add_argument('--seconds', type=float, default=10)
+        parser.add_argument(
+            '--journal-mode', choices=['wal', 'delete'],
+            help="Override SQLITE_PRAGMAS['journal_mode'] for this run to compare modes.",
+        )
+
+    def _worker(self, kind, deadline, results, lock):
+        client = Client(HTTP_HOST='localhost')
+        rng = random.Random()
+        timings, errors = [], 0
+        try:
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                if kind == 'read':
+                    # A random guest count gives each request its own cache key, so every read hits the database.
+                    response = client.get(reverse('landing'), {'area': 'Barra', 'guests': rng.randrange(1, 100000)})
+                    ok = response.status_code == 200
+                else:
+                    response = client.post(reverse('contact'), {
+                        'full_name': 'Bench', 'email': BENCH_EMAIL, 'subject': 'General',
+                        'message': 'Concurrency benchmark',
+                    }, headers={'X-Requested-With': 'XMLHttpRequest'})
+                    ok = response.status_code == 200 and response.json().get('success')
+                if ok:
+                    timings.append(time.perf_counter() - start)
+                else:
+                    errors += 1
+        finally:
+            connection.close()
+        with lock:
+            results[kind][0].extend(timings)
+            results[kind][1] += errors
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            self.stderr.write(f"Database is {connection.vendor}; this benchmark targets SQLite.")
+        if options['journal_mode']:
+            settings.SQLITE_PRAGMAS = {**settings.SQLITE_PRAGMAS, 'journal_mode': options['journal_mode']}
+        connections.close_all()  # reopen with the pragmas for this run
+
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode')
+            journal_mode = cursor.fetchone()[0]
+
+        results = {'read': [[], 0], 'write': [[], 0]}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + options['seconds']
+        threads = [
+            threading.Thread(target=self._worker, args=(kind, deadline, results, lock))
+            for kind, count in (('read', options['readers']), ('write', options['writers']))
+            for _ in range(count)
+        ]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            deleted, _ = ContactMessage.objects.filter(email=BENCH_EMAIL).delete()
+
+        self.stdout.write(
+            f"journal_mode={journal_mode}  readers={options['readers']}  "
+            f"writers={options['writers']}  {options['seconds']:g}s"
+        )
+        for kind, (timings, errors) in results.items():
+            timings.sort()
+            p95 = timings[int(len(timings) * 0.95) - 1] * 1000 if timings else 0
+            self.stdout.write(
+                f"  {kind:5}  {len(timings) / options['seconds']:8.1f} req/s   "
+                f"p95 {p95:7.1f} ms   errors {errors}"
+            )
+        self.stdout.write(f"Removed {deleted} benchmark messages.")
@@ -0,0 +1,71 @@
+import tempfile
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.template import RequestContext, Template
+from django.template.loader import render_to_string
+from django.test import RequestFactory, override_settings
+
+from website.facets import area_options
+from website.forms import BanquetForm, ContactMessageForm, LoginForm, ScheduleCallForm, SignUpForm
+
+PAGES = {
+    'landing.html': lambda: {'banquets': [], 'page': None, 'AREA_OPTIONS': area_options},
+    'banquet.html': lambda: {'banquets': [], 'page': None},
+    'about.html': dict,
+    'contact.html': lambda: {'form': ContactMessageForm()},
+    'login.html': lambda: {'form': LoginForm()},
+    'signup.html': lambda: {'form': SignUpForm()},
+    'register.html': lambda: {'form': BanquetForm()},
+    'schedule-call.html': lambda: {'form': ScheduleCallForm()},
+}
+
+# The page chrome with and without its {% cache %} fragments
+FRAGMENTS = {
+    'chrome, {% cache %}': (
+        "{% load cache %}{% cache 3600 site_header %}{% include 'header.html' %}{% endcache %}"
+        "{% cache 3600 site_footer %}{% include 'footer.html' %}{% endcache %}"
+    ),
+    'chrome, rendered': "{% include 'header.html' %}{% include 'footer.html' %}",
+}
+
+
+class Command(BaseCommand):
+    help = "Time template rendering per page (no view or database work beyond what the templates do)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=300)
+
+    def handle(self, *args, **options):
+        request = RequestFactory().get('/', HTTP_HOST='localhost')
+        request.user = AnonymousUser()
+        # A private, empty copy of the configured cache backend, so fragment
+        # reads cost what they do in production without touching its cache.
+        with tempfile.TemporaryDirectory() as location, override_settings(CACHES=_private_caches(location)):
+            self.stdout.write(f"{'template':20} {'first':>9} {'mean':>9} {'p95':>9}")
+            for name, context in PAGES.items():
+                self._time(name, options['repeat'], lambda: render_to_string(name, context(), request))
+            for name, source in FRAGMENTS.items():
+                template = Template(source)
+                self._time(name, options['repeat'], lambda: template.render(RequestContext(request)))
+
+    def _time(self, name, repeat, render):
+        timings = []
+        for _ in range(repeat + 1):
+            start = time.perf_counter()
+            render()
+            timings.append(time.perf_counter() - start)
+        first, timings = timings[0], sorted(timings[1:])
+        self.stdout.write(
+            f"{name:20} {first * 1000:7.2f}ms {sum(timings) / len(timings) * 1000:7.2f}ms "
+            f"{timings[int(len(timings) * 0.95) - 1] * 1000:7.2f}ms"
+        )
+
+
+def _private_caches(location):
+    backend = settings.CACHES['default']['BACKEND']
+    if backend.endswith('FileBasedCache'):
+        return {'default': {'BACKEND': backend, 'LOCATION': location}}
+    return {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'bench-templates'}}
@@ -0,0 +1,70 @@
+import gzip
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+from website.assets import (
+    BUNDLE_DIR, BUNDLES, IMAGE_MANIFEST, IMAGE_SOURCE_DIR, build_image_variants, bundle_css, bundle_js,
+    bundle_path, image_record,
+)
+
+BUILDERS = {'css': bundle_css, 'js': bundle_js}
+
+
+class Command(BaseCommand):
+    help = (
+        "Bundle and minify each page's CSS/JS and render AVIF/WebP/JPEG widths of static "
+        "images into static/dist/, then run collectstatic so everything gets hashed names "
+        "and gzip/Brotli variants."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--no-collect', action='store_true', help="Only write the bundles and images.")
+        parser.add_argument('--skip-images', action='store_true', help="Keep previously built image variants.")
+
+    def handle(self, *args, **options):
+        source_root = Path(settings.STATICFILES_DIRS[0])
+        (source_root / BUNDLE_DIR).mkdir(exist_ok=True)
+
+        total_in = total_out = 0
+        for page, kinds in BUNDLES.items():
+            for kind, paths in kinds.items():
+                sources = [(source_root / path).read_text(encoding='utf-8') for path in paths]
+                output = BUILDERS[kind](sources)
+                (source_root / bundle_path(page, kind)).write_text(output, encoding='utf-8')
+
+                size_in = sum(len(text.encode()) for text in sources)
+                size_out = len(output.encode())
+                total_in += size_in
+                total_out += size_out
+                self.stdout.write(
+                    f"{bundle_path(page, kind):24} {len(paths)} files  {size_in:7d} -> {size_out:7d} B"
+                    f"  ({len(gzip.compress(output.encode())):6d} B gzip)"
+                )
+        self.stdout.write(self.style.SUCCESS(f"Bundled {total_in} B of sources into {total_out} B."))
+
+        if not options['skip_images']:
+            self._build_images(source_root)
+
+        if not options['no_collect']:
+            call_command('collectstatic', interactive=False, verbosity=options['verbosity'])
+
+    def _build_images(self, source_root):
+        (source_root / BUNDLE_DIR / IMAGE_SOURCE_DIR).mkdir(parents=True, exist_ok=True)
+        records = {}
+        for file in sorted((source_root / IMAGE_SOURCE_DIR).iterdir()):
+            if file.suffix.lower() not in ('.jpg', '.jpeg', '.png'):
+                continue
+            path = f'{IMAGE_SOURCE_DIR}/{file.name}'
+            records[path] = image_record(file)
+            totals = {}
+            for variant, data in build_image_variants(path, file):
+                (source_root / variant).write_bytes(data)
+                ext = variant.rsplit('.', 1)[1]
+                totals[ext] = totals.get(ext, 0) + len(data)
+            sizes = '  '.join(f'{ext} {size // 1024} KB' for ext, size in totals.items())
+            self.stdout.write(f"{path:24} {file.stat().st_size // 1024:5d} KB -> {sizes} (all widths)")
+        (source_root / IMAGE_MANIFEST).write_text(json.dumps(records, indent=1), encoding='utf-8')
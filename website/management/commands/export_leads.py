@@ -0,0 +1,67 @@
+import datetime
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from website.exports import LEAD_MODELS, get_cursor, lead_queryset, stream_leads
+
+
+def _moment(value):
+    """Parse ``YYYY-MM-DD`` (local midnight) or an ISO datetime into an aware datetime."""
+    if not value:
+        return None
+    try:
+        moment = parse_datetime(value)
+        day = None if moment else parse_date(value)
+    except ValueError:
+        moment = day = None
+    if moment is None:
+        if day is None:
+            raise CommandError(f"Invalid date: {value!r}")
+        moment = datetime.datetime.combine(day, datetime.time.min)
+    return timezone.make_aware(moment) if timezone.is_naive(moment) else moment
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream ScheduleCall or ContactMessage leads as CSV or JSON Lines in constant memory. "
+        "With --incremental only leads added since the previous incremental export are written."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('leads', choices=sorted(LEAD_MODELS))
+        parser.add_argument('--format', choices=['csv', 'jsonl'], default='csv')
+        parser.add_argument('--since', help="Created on/after this date or datetime.")
+        parser.add_argument('--until', help="Created before this date or datetime.")
+        parser.add_argument('--incremental', action='store_true', help="Resume after the last exported id.")
+        parser.add_argument('--cursor', help="Cursor name for --incremental (default: the leads name).")
+        parser.add_argument('--output', '-o', help="File to write (default: stdout).")
+
+    def handle(self, *args, **options):
+        key = options['leads']
+        cursor = get_cursor(options['cursor'] or key) if options['incremental'] else None
+        rows = lead_queryset(
+            LEAD_MODELS[key].objects.all(),
+            since=_moment(options['since']),
+            until=_moment(options['until']),
+            after_id=cursor.last_id if cursor else None,
+        )
+
+        start = time.perf_counter()
+        out = open(options['output'], 'w', encoding='utf-8', newline='') if options['output'] else sys.stdout
+        try:
+            size = 0
+            for chunk in stream_leads(rows, options['format'], cursor):
+                out.write(chunk)
+                size += len(chunk)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+
+        summary = f"Exported {key} ({size / 1e6:.1f} MB) in {time.perf_counter() - start:.1f}s"
+        if cursor:
+            summary += f"; cursor '{cursor.name}' is now at id {cursor.last_id}"
+        self.stderr.write(summary)
@@ -0,0 +1,96 @@
+import json
+import time
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from website.cache import bump_listing_version
+from website.facets import rebuild_facets
+from website.imports import IMPORT_BATCH_SIZE, RowValidator, error_text, read_rows, upsert_banquets
+
+SHOWN_REJECTS = 20
+
+
+class Command(BaseCommand):
+    help = (
+        "Create or update banquets from a partner's CSV or JSON Lines file. Rows are validated "
+        "like BanquetForm, locations are matched to KANPUR_AREAS and rows are upserted in "
+        "batches on (owner, external_ref)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--owner', required=True, help="Username that will own the imported banquets.")
+        parser.add_argument('--format', choices=['csv', 'jsonl'], help="Default: from the file extension.")
+        parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE)
+        parser.add_argument('--allow-unknown-areas', action='store_true',
+                            help="Keep rows whose location matches no known area instead of rejecting them.")
+        parser.add_argument('--rejects', help="Write rejected rows with their errors to this JSONL file.")
+        parser.add_argument('--dry-run', action='store_true', help="Validate only; write nothing.")
+
+    def handle(self, *args, **options):
+        try:
+            owner = User.objects.get(username=options['owner'])
+        except User.DoesNotExist:
+            raise CommandError(f"No user named {options['owner']!r}")
+        path = Path(options['path'])
+        fmt = options['format'] or ('jsonl' if path.suffix in ('.jsonl', '.ndjson') else 'csv')
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        self.verbosity = options['verbosity']
+        validator = RowValidator(owner, options['allow_unknown_areas'])
+        rejects_file = open(options['rejects'], 'w', encoding='utf-8') if options['rejects'] else None
+        start = time.perf_counter()
+        total = rejected = upserted = 0
+        batch = []
+        try:
+            with open(path, encoding='utf-8-sig', newline='') as file:
+                for line_no, row in read_rows(file, fmt):
+                    total += 1
+                    banquet, errors = validator.clean(row)
+                    if errors:
+                        rejected += 1
+                        self._reject(line_no, row, errors, rejected, rejects_file)
+                        continue
+                    batch.append(banquet)
+                    if len(batch) >= options['batch_size']:
+                        upserted += self._flush(batch, options['dry_run'])
+                        self._progress(total, start)
+                upserted += self._flush(batch, options['dry_run'])
+        finally:
+            if rejects_file:
+                rejects_file.close()
+            if upserted and not options['dry_run']:
+                # Batches commit as they go and bulk_create sends no signals, so
+                # recount facets and drop cached listings once, even after an error.
+                with transaction.atomic():
+                    rebuild_facets()
+                bump_listing_version()
+
+        elapsed = time.perf_counter() - start
+        verb = "Validated" if options['dry_run'] else "Upserted"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {upserted} banquets from {total} rows ({rejected} rejected) "
+            f"in {elapsed:.1f}s, {total / elapsed if elapsed else 0:.0f} rows/s."
+        ))
+        if rejected > SHOWN_REJECTS and not rejects_file:
+            self.stdout.write(f"Only the first {SHOWN_REJECTS} rejects were shown; use --rejects to keep all.")
+
+    def _flush(self, batch, dry_run):
+        count = len(batch) if dry_run else upsert_banquets(batch)
+        batch.clear()
+        return count
+
+    def _progress(self, total, start):
+        if self.verbosity >= 2:
+            elapsed = time.perf_counter() - start
+            self.stderr.write(f"{total} rows, {total / elapsed:.0f} rows/s")
+
+    def _reject(self, line_no, row, errors, count, rejects_file):
+        if rejects_file:
+            rejects_file.write(json.dumps({'line': line_no, 'row': row, 'errors': errors}, default=str) + '\n')
+        if count <= SHOWN_REJECTS:
+            self.stderr.write(f"line {line_no}: {error_text(errors)}")
@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from website.models import BanquetImage
+from website.tasks import process_image
+
+
+class Command(BaseCommand):
+    help = "Process pending banquet image uploads (EXIF stripping and resized variants)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help="Keep polling for new uploads.")
+        parser.add_argument('--interval', type=float, default=5.0, help="Seconds between polls with --loop.")
+        parser.add_argument('--batch-size', type=int, default=50)
+        parser.add_argument(
+            '--include-stuck', action='store_true',
+            help="Also retry images left in 'processing' or 'failed' by a crashed worker.",
+        )
+
+    def handle(self, *args, **options):
+        claim_from = [BanquetImage.Status.PENDING]
+        if options['include_stuck']:
+            claim_from += [BanquetImage.Status.PROCESSING, BanquetImage.Status.FAILED]
+
+        last_id = 0
+        while True:
+            ids = list(
+                BanquetImage.objects.filter(status__in=claim_from, id__gt=last_id)
+                .order_by('id').values_list('id', flat=True)[:options['batch_size']]
+            )
+            if ids:
+                done = sum(process_image(image_id, claim_from=claim_from) for image_id in ids)
+                self.stdout.write(f"Processed {done}/{len(ids)} images.")
+                last_id = ids[-1]
+            elif options['loop']:
+                last_id = 0
+                time.sleep(options['interval'])
+            else:
+                break
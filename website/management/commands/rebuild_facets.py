@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from website.cache import bump_listing_version
+from website.facets import rebuild_facets
+from website.models import AreaFacet
+
+
+class Command(BaseCommand):
+    help = "Rebuild the area facet table (venue counts and capacity histogram) from scratch."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            rebuild_facets()
+        bump_listing_version()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {AreaFacet.objects.count()} area facets."))
@@ -0,0 +1,245 @@
+import fcntl
+import glob
+import hashlib
+import itertools
+import mmap
+import os
+import threading
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from django.conf import settings
+
+# ===== METRIC TYPES =====
+# Label values are fixed up front (anything else is counted as "other"), so
+# every series has a known slot in one flat array of doubles per process.
+OTHER = 'other'
+
+
+class _Metric:
+    kind = None
+    width = 1  # slots per series
+
+    def __init__(self, name, help_text, labels):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labels)
+        self.allowed = [frozenset(values) for values in labels.values()]
+        self.series = list(itertools.product(*(tuple(values) + (OTHER,) for values in labels.values())))
+        self.index = {values: i for i, values in enumerate(self.series)}
+        self.offset = 0
+
+    @property
+    def slots(self):
+        return len(self.series) * self.width
+
+    def _slot(self, labels):
+        values = tuple(
+            value if value in allowed else OTHER
+            for value, allowed in zip((labels.get(name) for name in self.labelnames), self.allowed)
+        )
+        return self.offset + self.index[values] * self.width
+
+    def _labels(self, values, **extra):
+        pairs = [*zip(self.labelnames, values), *extra.items()]
+        return '{' + ','.join(f'{name}="{value}"' for name, value in pairs) + '}' if pairs else ''
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        REGISTRY.add(self._slot(labels), amount)
+
+    def value(self, values, data):
+        return data[self.offset + self.index[values]]
+
+    def render(self, data):
+        for values in self.series:
+            value = self.value(values, data)
+            if value:
+                yield f'{self.name}{self._labels(values)} {_number(value)}'
+
+
+class Histogram(_Metric):
+    """Per series: one count per bucket (the last is +Inf), then the sum."""
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, labels, buckets):
+        self.buckets = tuple(buckets)
+        self.width = len(self.buckets) + 2
+        super().__init__(name, help_text, labels)
+
+    def observe(self, value, **labels):
+        slot = self._slot(labels)
+        REGISTRY.add(slot + bisect_left(self.buckets, value), 1, slot + self.width - 1, value)
+
+    def render(self, data):
+        for values in self.series:
+            start = self.offset + self.index[values] * self.width
+            counts = data[start:start + self.width - 1]
+            if not any(counts):
+                continue
+            total = 0
+            for bound, count in zip((*self.buckets, '+Inf'), counts):
+                total += count
+                yield f'{self.name}_bucket{self._labels(values, le=bound)} {_number(total)}'
+            yield f'{self.name}_sum{self._labels(values)} {_number(data[start + self.width - 1])}'
+            yield f'{self.name}_count{self._labels(values)} {_number(total)}'
+
+
+def _number(value):
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+# ===== REGISTRY =====
+class Registry:
+    """Values of every metric, summed over all worker processes.
+
+    With ``METRICS_DIR`` set, each process adds into its own memory-mapped
+    file ``<layout>-<pid>.db``; a scrape sums all of them plus
+    ``<layout>-archive.db``, into which gunicorn folds the file of every
+    worker that exits (see gunicorn.conf.py), so recycled workers keep their
+    counts without files piling up. Without it, values live in memory and
+    only cover the current process (runserver, tests).
+    """
+
+    def __init__(self):
+        self.metrics = []
+        self.size = 0
+        self._lock = threading.Lock()
+        self._pid = None
+        self._data = None
+
+    def register(self, metric):
+        metric.offset = self.size
+        self.size += metric.slots
+        self.metrics.append(metric)
+        return metric
+
+    @property
+    def layout(self):
+        # Files written under another set of metrics are never mixed in
+        shape = [(m.name, m.series, getattr(m, 'buckets', None)) for m in self.metrics]
+        return hashlib.md5(repr(shape).encode()).hexdigest()[:8]
+
+    def _values(self):
+        if self._pid != os.getpid():  # first use, or a forked child
+            self._pid = os.getpid()
+            directory = settings.METRICS_DIR
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+                fd = os.open(os.path.join(directory, f'{self.layout}-{self._pid}.db'), os.O_RDWR | os.O_CREAT)
+                os.ftruncate(fd, self.size * 8)
+                buffer = mmap.mmap(fd, self.size * 8)
+                os.close(fd)
+            else:
+                buffer = bytearray(self.size * 8)
+            self._data = memoryview(buffer).cast('d')
+        return self._data
+
+    def add(self, slot, amount, *more):
+        """Add ``amount`` at ``slot``; ``more`` holds further (slot, amount) pairs."""
+        with self._lock:
+            data = self._values()
+            data[slot] += amount
+            for i in range(0, len(more), 2):
+                data[more[i]] += more[i + 1]
+
+    def collect(self):
+        directory = settings.METRICS_DIR
+        if not directory:
+            with self._lock:
+                return array('d', self._values())
+        self._values()  # make sure this process has its file
+        totals = array('d', bytes(self.size * 8))
+        with _locked(directory, fcntl.LOCK_SH):
+            for path in glob.glob(os.path.join(directory, f'{self.layout}-*.db')):
+                _add_file(totals, path)
+        return totals
+
+    def render(self, data):
+        lines = []
+        for metric in self.metrics:
+            lines += [f'# HELP {metric.name} {metric.help}', f'# TYPE {metric.name} {metric.kind}']
+            lines += metric.render(data)
+        return lines
+
+
+def _add_file(totals, path):
+    try:
+        with open(path, 'rb') as file:
+            values = array('d', file.read())
+    except (FileNotFoundError, ValueError):
+        return
+    if len(values) == len(totals):  # skip a file still being created
+        for i, value in enumerate(values):
+            if value:
+                totals[i] += value
+
+
+@contextmanager
+def _locked(directory, operation):
+    with open(os.path.join(directory, '.lock'), 'a') as lock:
+        fcntl.flock(lock, operation)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def merge_process(directory, pid):
+    """Fold an exited worker's files into the archive (gunicorn ``child_exit``)."""
+    with _locked(directory, fcntl.LOCK_EX):
+        for path in glob.glob(os.path.join(directory, f'*-{pid}.db')):
+            layout = os.path.basename(path).split('-')[0]
+            archive = os.path.join(directory, f'{layout}-archive.db')
+            with open(archive if os.path.exists(archive) else path, 'rb') as file:
+                totals = array('d', file.read())
+            if os.path.exists(archive):
+                _add_file(totals, path)
+            with open(archive + '.tmp', 'wb') as file:
+                totals.tofile(file)
+            os.replace(archive + '.tmp', archive)
+            os.remove(path)
+
+
+REGISTRY = Registry()
+
+# ===== METRICS =====
+METRIC_VIEWS = ('landing', 'banquet', 'signup', 'register_banquet', 'schedule_call', 'contact')
+METRIC_FORMS = ('signup', 'login', 'register_banquet', 'schedule_call', 'contact')
+
+REQUEST_LATENCY = REGISTRY.register(Histogram(
+    'http_request_duration_seconds', 'Request latency by URL name and status class.',
+    {'view': METRIC_VIEWS, 'status': ('2xx', '3xx', '4xx', '5xx')},
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+))
+FORM_SUBMISSIONS = REGISTRY.register(Counter(
+    'form_submissions_total', 'POSTed forms by outcome (success, invalid or error).',
+    {'form': METRIC_FORMS, 'outcome': ('success', 'invalid', 'error')},
+))
+LISTING_CACHE = REGISTRY.register(Counter(
+    'listing_cache_requests_total', 'Listing page cache lookups (see website.cache).',
+    {'result': ('hit', 'miss')},
+))
+
+
+def listing_cache_counts(data=None):
+    """``(hits, misses)`` of the listing cache, summed over all workers."""
+    data = REGISTRY.collect() if data is None else data
+    return tuple(int(LISTING_CACHE.value((result,), data)) for result in ('hit', 'miss'))
+
+
+def render_metrics():
+    """Prometheus text exposition of every metric plus the listing cache hit ratio."""
+    data = REGISTRY.collect()
+    lines = REGISTRY.render(data)
+    hits, misses = listing_cache_counts(data)
+    lines += [
+        '# HELP listing_cache_hit_ratio Share of listing cache lookups served from the cache.',
+        '# TYPE listing_cache_hit_ratio gauge',
+        f'listing_cache_hit_ratio {_number(round(hits / (hits + misses), 4)) if hits + misses else 0}',
+    ]
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,85 @@
+import json
+import logging
+import random
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from .metrics import REQUEST_LATENCY
+from .timing import RequestTimer
+
+logger = logging.getLogger('website.timing')
+
+
+# ===== REQUEST TIMING =====
+class RequestTimingMiddleware:
+    """Measure every request: wall time, SQL queries and time, template time
+    and response size. Wall time also feeds the latency histogram in
+    website.metrics.
+
+    The three timings are sent in a ``Server-Timing`` header (shown in the
+    browser's network panel). A JSON log line with all four, size included,
+    is written for a random ``TIMING_SAMPLE_RATE`` share of requests, and
+    always - as a warning - for requests over ``TIMING_SLOW_MS`` or
+    ``TIMING_SLOW_QUERIES``.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with RequestTimer() as timer:
+            response = self.get_response(request)
+        self.finish(request, response, timer)
+        return response
+
+    async def __acall__(self, request):
+        with RequestTimer() as timer:
+            response = await self.get_response(request)
+        self.finish(request, response, timer)
+        return response
+
+    def finish(self, request, response, timer):
+        elapsed = timer.elapsed
+        match = request.resolver_match
+        view = match.view_name if match else None
+        REQUEST_LATENCY.observe(elapsed, view=view, status=f'{response.status_code // 100}xx')
+
+        wall_ms = elapsed * 1000
+        db_ms = timer.db_time * 1000
+        template_ms = timer.template_time * 1000
+
+        if settings.TIMING_HEADER:
+            response['Server-Timing'] = (
+                f'app;dur={wall_ms:.1f}, db;dur={db_ms:.1f};desc="{timer.queries} queries", '
+                f'tpl;dur={template_ms:.1f}'
+            )
+
+        slow = wall_ms >= settings.TIMING_SLOW_MS or timer.queries >= settings.TIMING_SLOW_QUERIES
+        if not slow and random.random() >= settings.TIMING_SAMPLE_RATE:
+            return
+        logger.log(logging.WARNING if slow else logging.INFO, json.dumps({
+            'view': view,
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'wall_ms': round(wall_ms, 1),
+            'queries': timer.queries,
+            'db_ms': round(db_ms, 1),
+            'template_ms': round(template_ms, 1),
+            'bytes': response_size(response),
+            'slow': slow,
+        }))
+
+
+def response_size(response):
+    """Body size in bytes, or None for a stream whose length isn't known yet."""
+    if response.has_header('Content-Length'):
+        return int(response['Content-Length'])
+    return None if response.streaming else len(response.content)
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.6 on 2026-10-18 09:37
+
+import re
+
+from django.conf import settings
+from django.db import migrations, models
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+
+def normalize_area(value):
+    # Frozen copy of website.areas.normalize_area as of this migration
+    if not value:
+        return ''
+    return _NON_ALNUM.sub(' ', value.casefold()).strip()
+
+
+def backfill_location_key(apps, schema_editor):
+    Banquet = apps.get_model('website', 'Banquet')
+    banquets = list(Banquet.objects.only('id', 'location'))
+    for banquet in banquets:
+        banquet.location_key = normalize_area(banquet.location)
+    Banquet.objects.bulk_update(banquets, ['location_key'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0005_venue'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='banquet',
+            name='location_key',
+            field=models.CharField(default='', editable=False, max_length=255),
+        ),
+        migrations.RunPython(backfill_location_key, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='banquet',
+            index=models.Index(fields=['location_key', 'capacity'], name='banquet_area_capacity_idx'),
+        ),
+    ]
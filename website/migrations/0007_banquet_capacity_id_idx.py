@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-18 09:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0006_banquet_location_key'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='banquet',
+            index=models.Index(fields=['capacity', 'id'], name='banquet_capacity_id_idx'),
+        ),
+    ]
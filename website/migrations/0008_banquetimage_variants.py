@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-18 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0007_banquet_capacity_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='banquetimage',
+            name='card_image',
+            field=models.ImageField(blank=True, editable=False, upload_to='banquet_images/variants/'),
+        ),
+        migrations.AddField(
+            model_name='banquetimage',
+            name='hero_image',
+            field=models.ImageField(blank=True, editable=False, upload_to='banquet_images/variants/'),
+        ),
+        migrations.AddField(
+            model_name='banquetimage',
+            name='thumbnail',
+            field=models.ImageField(blank=True, editable=False, upload_to='banquet_images/variants/'),
+        ),
+    ]
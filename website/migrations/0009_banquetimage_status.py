@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-18 09:40
+
+from django.db import migrations, models
+
+
+def mark_existing_ready(apps, schema_editor):
+    # Images uploaded before background processing are served as they are
+    # (missing variants fall back to the original), not queued as pending.
+    BanquetImage = apps.get_model('website', 'BanquetImage')
+    BanquetImage.objects.update(status='ready')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0008_banquetimage_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='banquetimage',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('ready', 'Ready'), ('failed', 'Failed')], db_index=True, default='pending', max_length=20),
+        ),
+        migrations.RunPython(mark_existing_ready, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.6 on 2026-10-18 09:43
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+# Frozen copies of website.constants.CAPACITY_BUCKETS and
+# website.facets.rebuild_facets as of this migration
+CAPACITY_BUCKETS = [
+    (100, 'capacity_0_100'),
+    (300, 'capacity_101_300'),
+    (500, 'capacity_301_500'),
+    (1000, 'capacity_501_1000'),
+    (None, 'capacity_over_1000'),
+]
+
+
+def rebuild_facets(Banquet, AreaFacet):
+    buckets = {}
+    lower = 0
+    for upper, field in CAPACITY_BUCKETS:
+        condition = Q(capacity__gt=lower) if lower else Q()
+        if upper is not None:
+            condition &= Q(capacity__lte=upper)
+        buckets[field] = Count('id', filter=condition)
+        lower = upper
+
+    rows = Banquet.objects.values('location_key').annotate(venue_count=Count('id'), **buckets)
+    AreaFacet.objects.all().delete()
+    AreaFacet.objects.bulk_create(
+        [AreaFacet(area_key=row.pop('location_key'), **row) for row in rows],
+        batch_size=500,
+    )
+
+
+def backfill_facets(apps, schema_editor):
+    rebuild_facets(apps.get_model('website', 'Banquet'), apps.get_model('website', 'AreaFacet'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0009_banquetimage_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AreaFacet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('area_key', models.CharField(max_length=255, unique=True)),
+                ('venue_count', models.IntegerField(default=0)),
+                ('capacity_0_100', models.IntegerField(default=0)),
+                ('capacity_101_300', models.IntegerField(default=0)),
+                ('capacity_301_500', models.IntegerField(default=0)),
+                ('capacity_501_1000', models.IntegerField(default=0)),
+                ('capacity_over_1000', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_facets, migrations.RunPython.noop),
+    ]
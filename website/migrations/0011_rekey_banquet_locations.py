@@ -0,0 +1,168 @@
+import math
+import re
+from collections import defaultdict
+
+from django.db import migrations
+from django.db.models import Count, Q
+
+# ===== FROZEN AREA RESOLUTION =====
+# Copies of website.constants.KANPUR_AREAS and website.areas.area_key as of
+# this migration, so later edits to the app cannot change what it writes.
+KANPUR_AREAS = [
+    'Agriculture College', 'Amour', 'Anand Nagar', 'Anwarganj', 'Aranjhami', 'Armapore',
+    'Armapore Estate', 'Arya Nagar', 'Ashok Nagar', 'Avas Vikas yojna no. 3', 'B N shukla & sons',
+    'Baikuthpur', 'Bairi', 'Baraigarh', 'Barra', 'Bausar', 'Behta Gambhirpur', 'Bhadrsa',
+    'Bhairampur', 'Bharu', 'Bhauti Pratappur', 'Bheoli', 'Bhimsen', 'Bidhnoo', 'Bima Vihar',
+    'Binour', 'Birhana Raod', 'Bisayakpur', 'Bithoor', 'Cambridge Road', 'Chakarpur',
+    'Chakeri Aerodrum', 'Chauki Jarib', 'Chaurai', 'Chhatarpur', 'Colonelganj', 'Cotton Mill',
+    'D O oil mill', 'Dehli Ujagar', 'Deosarh', 'Dhankutti', 'Elgin Mills', 'Employeement Exchange',
+    'Fahimabad', 'Farrashkhana', 'Fatehpur Roshnai', 'Gayatri Seedh peeth khadeshar', 'Gazipur',
+    'Gopalpur', 'Govind Nagar', 'Govind Nagar west', 'GSVM Medical College', 'Gwaltoli',
+    'Hal Colony', 'Harchandkhera', 'Hardauli', 'Harjinder Nagar', 'Hathigaon', 'Hatia', 'Hbti',
+    'Hns Nagar', 'Indira Nagar', 'Industrial Estate', 'Itra', 'J K puri', 'Jamu', 'Jawahar Nagar',
+    'Jugrajpur', 'Juhi Colony', 'K M street', 'K P university', 'Kadari Champatpur', 'Kaindha',
+    'Kalyanpur', 'Kamlapur', 'Kanpur', 'Kanpur Cantt.', 'Kanpur Chowk', 'Kanpur Court',
+    'Kanpur West', 'Karbigvan', 'Kasigaon', 'Kathara', 'Katherua', 'Kathongar', 'Kaushalpuri',
+    'Khapra Mohal', 'Kheora', 'Kidwai Nagar', 'Krishna Nagar', 'Kudani', 'Kulgaon', 'Maharajpur',
+    'Maholi', 'Mahua Gaon', 'Majhawan', 'Mandhana', 'Mardanpur', 'Meerpur Cantt', 'Motijheel',
+    'Muir Mill', 'Munshipurwa', 'N C line', 'N H road', 'Napier Road', 'Naramau',
+    'Narona Exchange', 'Narwal', 'Nasra', 'Naveen Market', 'Naveen Nagar', 'Nawabganj', 'Nayaganj',
+    'New Pac lines', 'Nirala Nagar', 'Nsi', 'Oe Factory', 'Pachor', 'Palhepur', 'Pali Bhogipur',
+    'Panki', 'Panki Ganga ganj', 'Parasadepur', 'Parsauli', 'Pem', 'Philkhana', 'Phuphuwar',
+    'Pipergaon', 'Prempur Badagaon', 'Purana Kanpur', 'Purwameer', 'R K nagar', 'Rbi Colony',
+    'Railganj', 'Raipur Kukhat', 'Ramaipur', 'Rambagh', 'Rania', 'Rasulpur Umra',
+    'Ratan Lal nagar', 'Rawatpur', 'Rooma', 'Ramadevi', 'S C mills', 'Sachendi', 'Saketpuri',
+    'Salempur', 'Sanigawan', 'Sapai', 'Sarh', 'Sarsaul', 'Sarvodaya Nagar', 'Sawaijpur',
+    'Semarjhal', 'Senpara Paschim', 'Shivaji Nagar', 'Shyam Nagar', 'Sirhi Itra', 'Sisamau',
+    'Subhauli', 'Swarup Nagar', 'T P nagar', 'Tatya Ganj', 'Taudhakpur', 'Tikra', 'Tilsahari',
+    'Udaipur', 'Udyog Nagar', 'Vijai Nagar', 'Yashoda Nagar',
+]
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+CITY_KEY = 'kanpur'
+MIN_SIMILARITY = 0.62
+
+
+def normalize_area(value):
+    if not value:
+        return ''
+    return _NON_ALNUM.sub(' ', value.casefold()).strip()
+
+
+def _trigrams(key):
+    padded = f'  {key} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class AreaIndex:
+    def __init__(self, areas):
+        self.areas = list(areas)
+        self.by_key = {}
+        self.by_compact = {}
+        self.postings = defaultdict(list)
+        area_grams = []
+        for i, area in enumerate(self.areas):
+            key = normalize_area(area)
+            self.by_key.setdefault(key, area)
+            self.by_compact.setdefault(key.replace(' ', ''), area)
+            area_grams.append(_trigrams(key))
+            for gram in area_grams[-1]:
+                self.postings[gram].append(i)
+
+        count = len(self.areas) + 1
+        self.unseen_weight = math.log(count) + 1
+        self.weights = {gram: math.log(count / (len(ids) + 1)) + 1 for gram, ids in self.postings.items()}
+        self.postings = dict(self.postings)
+        self.mass = [sum(self.weights[g] for g in grams) for grams in area_grams]
+        self.max_words = max((len(k.split()) for k in self.by_key), default=1)
+
+    def _contained(self, key):
+        words = key.split()
+        matches = []
+        for size in range(min(self.max_words, len(words)), 0, -1):
+            for start in range(len(words) - size + 1):
+                area = self.by_key.get(' '.join(words[start:start + size]))
+                if area:
+                    matches.append((normalize_area(area) == CITY_KEY, -size, start, area))
+        return min(matches)[3] if matches else None
+
+    def _similar(self, key):
+        grams = _trigrams(key)
+        shared = defaultdict(float)
+        mass = 0.0
+        for gram in grams:
+            mass += self.weights.get(gram, self.unseen_weight)
+            for i in self.postings.get(gram, ()):
+                shared[i] += self.weights[gram]
+        best, best_score = None, MIN_SIMILARITY
+        for i, overlap in shared.items():
+            score = 2 * overlap / (mass + self.mass[i])
+            if score > best_score:
+                best, best_score = self.areas[i], score
+        return best
+
+    def resolve(self, text):
+        key = normalize_area(text)
+        if not key:
+            return None
+        return (
+            self.by_key.get(key)
+            or self.by_compact.get(key.replace(' ', ''))
+            or self._contained(key)
+            or self._similar(key)
+        )
+
+
+def area_key(index, text):
+    return normalize_area(index.resolve(text) or text)
+
+
+# ===== FROZEN FACET REBUILD =====
+# As in 0010_areafacet.
+CAPACITY_BUCKETS = [
+    (100, 'capacity_0_100'),
+    (300, 'capacity_101_300'),
+    (500, 'capacity_301_500'),
+    (1000, 'capacity_501_1000'),
+    (None, 'capacity_over_1000'),
+]
+
+
+def rebuild_facets(Banquet, AreaFacet):
+    buckets = {}
+    lower = 0
+    for upper, field in CAPACITY_BUCKETS:
+        condition = Q(capacity__gt=lower) if lower else Q()
+        if upper is not None:
+            condition &= Q(capacity__lte=upper)
+        buckets[field] = Count('id', filter=condition)
+        lower = upper
+
+    rows = Banquet.objects.values('location_key').annotate(venue_count=Count('id'), **buckets)
+    AreaFacet.objects.all().delete()
+    AreaFacet.objects.bulk_create(
+        [AreaFacet(area_key=row.pop('location_key'), **row) for row in rows],
+        batch_size=500,
+    )
+
+
+# ===== MIGRATION =====
+def rekey_locations(apps, schema_editor):
+    Banquet = apps.get_model('website', 'Banquet')
+    index = AreaIndex(KANPUR_AREAS)
+    banquets = list(Banquet.objects.only('id', 'location', 'location_key'))
+    for banquet in banquets:
+        banquet.location_key = area_key(index, banquet.location)
+    Banquet.objects.bulk_update(banquets, ['location_key'], batch_size=500)
+    rebuild_facets(Banquet, apps.get_model('website', 'AreaFacet'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0010_areafacet'),
+    ]
+
+    operations = [
+        migrations.RunPython(rekey_locations, migrations.RunPython.noop),
+    ]
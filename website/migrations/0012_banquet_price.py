@@ -0,0 +1,33 @@
+# Generated by Django 5.2.6 on 2026-10-18 09:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0011_rekey_banquet_locations'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='banquet',
+            name='price',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True),
+        ),
+        migrations.AlterField(
+            model_name='venue',
+            name='price',
+            field=models.DecimalField(db_index=True, decimal_places=2, max_digits=10),
+        ),
+        migrations.AddIndex(
+            model_name='banquet',
+            index=models.Index(fields=['location_key', 'price'], name='banquet_area_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='banquet',
+            index=models.Index(fields=['price'], name='banquet_price_idx'),
+        ),
+    ]
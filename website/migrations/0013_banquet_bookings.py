@@ -0,0 +1,41 @@
+# Generated by Django 5.2.6 on 2026-10-18 09:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0012_banquet_price'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BanquetBooking',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField()),
+                ('note', models.CharField(blank=True, max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('banquet', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='bookings', to='website.banquet')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['banquet', 'start_date', 'end_date'], name='booking_interval_idx')],
+                'constraints': [models.CheckConstraint(condition=models.Q(('end_date__gte', models.F('start_date'))), name='booking_dates_ordered')],
+            },
+        ),
+        migrations.CreateModel(
+            name='BanquetCalendar',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('booked', models.JSONField(default=list)),
+                ('banquet', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='calendars', to='website.banquet')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('banquet', 'year'), name='unique_banquet_calendar_year')],
+            },
+        ),
+    ]
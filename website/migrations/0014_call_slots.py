@@ -0,0 +1,54 @@
+# Generated by Django 5.2.6 on 2026-10-18 09:48
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_call_slots(apps, schema_editor):
+    ScheduleCall = apps.get_model('website', 'ScheduleCall')
+    CallSlot = apps.get_model('website', 'CallSlot')
+    rows = ScheduleCall.objects.values('date', 'time_slot').annotate(booked=Count('id'))
+    CallSlot.objects.bulk_create(
+        [
+            CallSlot(
+                date=row['date'], time_slot=row['time_slot'], booked=row['booked'],
+                capacity=max(row['booked'], settings.CALL_SLOT_CAPACITY),
+            )
+            for row in rows
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0013_banquet_bookings'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CallSlot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('time_slot', models.CharField(max_length=50)),
+                ('capacity', models.PositiveSmallIntegerField()),
+                ('booked', models.PositiveSmallIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='schedulecall',
+            index=models.Index(fields=['date', 'time_slot'], name='schedulecall_slot_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='callslot',
+            constraint=models.UniqueConstraint(fields=('date', 'time_slot'), name='unique_call_slot'),
+        ),
+        migrations.AddConstraint(
+            model_name='callslot',
+            constraint=models.CheckConstraint(condition=models.Q(('booked__lte', models.F('capacity'))), name='call_slot_not_overbooked'),
+        ),
+        migrations.RunPython(backfill_call_slots, migrations.RunPython.noop),
+    ]
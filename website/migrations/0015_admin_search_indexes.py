@@ -0,0 +1,60 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:04
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+# Admin ``^name`` search is ``UPPER(name::text) LIKE UPPER('abc%')``; a btree
+# can serve that prefix only with text_pattern_ops, which is PostgreSQL-only.
+NAME_PREFIX_INDEXES = [
+    ('website_schedulecall', 'name', 'schedulecall_name_prefix_idx'),
+    ('website_contactmessage', 'full_name', 'contactmessage_name_prefix_idx'),
+]
+
+
+def create_name_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, column, name in NAME_PREFIX_INDEXES:
+        schema_editor.execute(f'CREATE INDEX {name} ON {table} (UPPER({column}::text) text_pattern_ops)')
+
+
+def drop_name_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, column, name in NAME_PREFIX_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0014_call_slots'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['created_at'], name='contactmessage_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(django.db.models.functions.text.Upper('email'), name='contactmessage_email_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(django.db.models.functions.text.Upper('phone'), name='contactmessage_phone_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='schedulecall',
+            index=models.Index(fields=['created_at'], name='schedulecall_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='schedulecall',
+            index=models.Index(django.db.models.functions.text.Upper('email'), name='schedulecall_email_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='schedulecall',
+            index=models.Index(django.db.models.functions.text.Upper('phone'), name='schedulecall_phone_idx'),
+        ),
+        migrations.RunPython(create_name_prefix_indexes, drop_name_prefix_indexes),
+    ]
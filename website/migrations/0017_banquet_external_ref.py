@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0016_lead_export_cursor'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='banquet',
+            name='external_ref',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='banquet',
+            constraint=models.UniqueConstraint(fields=('owner', 'external_ref'), name='unique_banquet_owner_ref'),
+        ),
+    ]
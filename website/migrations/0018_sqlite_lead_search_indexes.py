@@ -0,0 +1,39 @@
+from django.db import migrations
+
+# On SQLite the admin's ``=email``/``=phone`` (iexact) and ``^name``
+# (istartswith) searches compile to ``col LIKE %s ESCAPE '\'``. LIKE is
+# case-insensitive there, so only a COLLATE NOCASE index can serve it; the
+# UPPER() expression indexes from 0015 are used by PostgreSQL alone.
+NOCASE_INDEXES = [
+    ('website_schedulecall', 'email', 'schedulecall_email_nocase_idx'),
+    ('website_schedulecall', 'phone', 'schedulecall_phone_nocase_idx'),
+    ('website_schedulecall', 'name', 'schedulecall_name_nocase_idx'),
+    ('website_contactmessage', 'email', 'contactmessage_email_nocase_idx'),
+    ('website_contactmessage', 'phone', 'contactmessage_phone_nocase_idx'),
+    ('website_contactmessage', 'full_name', 'contactmessage_name_nocase_idx'),
+]
+
+
+def create_nocase_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for table, column, name in NOCASE_INDEXES:
+        schema_editor.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {table} ({column} COLLATE NOCASE)')
+
+
+def drop_nocase_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for table, column, name in NOCASE_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0017_banquet_external_ref'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_nocase_indexes, drop_nocase_indexes),
+    ]
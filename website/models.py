@@ -1,6 +1,31 @@
 from django.db import models
+from django.db.models import OuterRef, Prefetch, Subquery
+from django.db.models.functions import Upper
+from django.utils import timezone
 from django.utils.html import mark_safe
 from django.contrib.auth.models import User
+from .areas import area_key
+from .images import IMAGE_VARIANTS
+
+# ===== BANQUET QUERYSET =====
+class BanquetQuerySet(models.QuerySet):
+    def for_listing(self, images=True):
+        """Shared builder for listing pages and the admin changelist.
+
+        Joins the owner and, when ``images`` is set, prefetches only each
+        banquet's cover (first) image, so a page costs a fixed number of
+        queries however many cards it shows.
+        """
+        queryset = self.select_related('owner')
+        if images:
+            first_image = BanquetImage.objects.filter(banquet=OuterRef('banquet')).order_by('id').values('id')[:1]
+            queryset = queryset.prefetch_related(Prefetch(
+                'images',
+                queryset=BanquetImage.objects.filter(id=Subquery(first_image)),
+                to_attr='cover_images',
+            ))
+        return queryset
+
 
 # ===== BANQUET MODEL =====
 class Banquet(models.Model):
@@ -10,13 +35,51 @@ class Banquet(models.Model):
     email = models.EmailField()
     phone = models.CharField(max_length=20)
     capacity = models.IntegerField()
+    price = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)  # INR, indexed below
     location = models.CharField(max_length=255)
     google_link = models.URLField(blank=True, null=True)
     services = models.CharField(max_length=100, blank=True, null=True)
+    location_key = models.CharField(max_length=255, editable=False, default='')  # normalized area, indexed below
+    external_ref = models.CharField(max_length=100, blank=True, null=True)  # partner's id, set by import_banquets
+
+    objects = BanquetQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['location_key', 'capacity'], name='banquet_area_capacity_idx'),
+            models.Index(fields=['capacity', 'id'], name='banquet_capacity_id_idx'),  # keyset pagination
+            models.Index(fields=['location_key', 'price'], name='banquet_area_price_idx'),
+            models.Index(fields=['price'], name='banquet_price_idx'),
+        ]
+        constraints = [
+            # Upsert key for bulk imports; NULL refs (form-created listings) never conflict
+            models.UniqueConstraint(fields=['owner', 'external_ref'], name='unique_banquet_owner_ref'),
+        ]
 
     def __str__(self):
         return self.banquet_name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if not instance.get_deferred_fields() & {'location_key', 'capacity'}:
+            # Stored values, so website.facets can move counts on update/delete
+            instance._facet_state = (instance.location_key, instance.capacity)
+        return instance
+
+    @property
+    def cover_image(self):
+        if hasattr(self, 'cover_images'):
+            return self.cover_images[0] if self.cover_images else None
+        return self.images.order_by('id').first()
+
+    def save(self, *args, **kwargs):
+        self.location_key = area_key(self.location)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'location' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'location_key'}
+        super().save(*args, **kwargs)
+
 
 
 # ===== VENUE MODEL (owners can list venues) =====
@@ -25,24 +88,117 @@ class Venue(models.Model):
     name = models.CharField(max_length=100)
     address = models.CharField(max_length=255)
     capacity = models.IntegerField()
-    price = models.DecimalField(max_digits=10, decimal_places=2)
+    price = models.DecimalField(max_digits=10, decimal_places=2, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
         return self.name
 
 
+# ===== AREA FACETS (maintained by website.facets) =====
+class AreaFacet(models.Model):
+    area_key = models.CharField(max_length=255, unique=True)
+    venue_count = models.IntegerField(default=0)
+    capacity_0_100 = models.IntegerField(default=0)
+    capacity_101_300 = models.IntegerField(default=0)
+    capacity_301_500 = models.IntegerField(default=0)
+    capacity_501_1000 = models.IntegerField(default=0)
+    capacity_over_1000 = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.area_key} ({self.venue_count})"
+
+
+# ===== BOOKINGS & AVAILABILITY =====
+class BanquetBooking(models.Model):
+    banquet = models.ForeignKey(Banquet, on_delete=models.CASCADE, related_name='bookings', db_index=False)  # led by booking_interval_idx
+    start_date = models.DateField()
+    end_date = models.DateField()  # inclusive
+    note = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # "is banquet X free on D": seek on banquet, range on start_date, end_date read from the index
+            models.Index(fields=['banquet', 'start_date', 'end_date'], name='booking_interval_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(end_date__gte=models.F('start_date')), name='booking_dates_ordered'),
+        ]
+
+    def __str__(self):
+        return f"{self.banquet.banquet_name}: {self.start_date} - {self.end_date}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Stored range, so website.availability can refresh the years it used to cover
+        instance._loaded_range = (instance.__dict__.get('start_date'), instance.__dict__.get('end_date'))
+        return instance
+
+
+class BanquetCalendar(models.Model):
+    """One row per banquet and year: twelve month bitmaps of booked days."""
+    banquet = models.ForeignKey(Banquet, on_delete=models.CASCADE, related_name='calendars')
+    year = models.PositiveSmallIntegerField()
+    booked = models.JSONField(default=list)  # 12 ints, bit (day - 1) set when booked
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['banquet', 'year'], name='unique_banquet_calendar_year'),
+        ]
+
+    def __str__(self):
+        return f"{self.banquet_id} - {self.year}"
+
+
 # ===== BANQUET IMAGES =====
 class BanquetImage(models.Model):
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        PROCESSING = 'processing', 'Processing'
+        READY = 'ready', 'Ready'
+        FAILED = 'failed', 'Failed'
+
     banquet = models.ForeignKey(Banquet, on_delete=models.CASCADE, related_name='images')
     image = models.ImageField(upload_to='banquet_images/')
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING, db_index=True)
+    # Derivatives written by website.images.generate_variants
+    thumbnail = models.ImageField(upload_to='banquet_images/variants/', blank=True, editable=False)
+    card_image = models.ImageField(upload_to='banquet_images/variants/', blank=True, editable=False)
+    hero_image = models.ImageField(upload_to='banquet_images/variants/', blank=True, editable=False)
 
     def __str__(self):
         return f"{self.banquet.banquet_name} Image"
 
+    @property
+    def is_processing(self):
+        return self.status in (self.Status.PENDING, self.Status.PROCESSING)
+
+    def variant_url(self, field):
+        variant = getattr(self, field)
+        if variant:
+            return variant.url
+        return self.image.url if self.image else ''
+
+    @property
+    def card_url(self):
+        return self.variant_url('card_image')
+
+    @property
+    def srcset(self):
+        return ', '.join(
+            f'{getattr(self, field).url} {width}w'
+            for field, (width, height, crop) in IMAGE_VARIANTS.items()
+            if getattr(self, field)
+        )
+
     def image_tag(self):
         if self.image:
-            return mark_safe(f'<img src="{self.image.url}" width="150" height="100" />')
+            return mark_safe(
+                f'<img src="{self.variant_url("thumbnail")}" srcset="{self.srcset}" sizes="150px" '
+                f'width="150" height="100" loading="lazy" decoding="async" />'
+            )
         return "No Image"
     image_tag.short_description = 'Image Preview'
 
@@ -57,9 +213,41 @@ class ScheduleCall(models.Model):
     notes = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['date', 'time_slot'], name='schedulecall_slot_idx'),
+            models.Index(fields=['created_at'], name='schedulecall_created_idx'),
+            # Admin exact-match search: on PostgreSQL ``=email``/``=phone`` compile to
+            # UPPER(col) = UPPER(%s). SQLite compiles them to LIKE, served by the
+            # COLLATE NOCASE indexes of migration 0018 instead.
+            models.Index(Upper('email'), name='schedulecall_email_idx'),
+            models.Index(Upper('phone'), name='schedulecall_phone_idx'),
+        ]
+
     def __str__(self):
         return f"{self.name} - {self.date}"
 
+# ===== CALL SLOT CAPACITY =====
+class CallSlot(models.Model):
+    """Remaining capacity of one ScheduleCall slot; see website.slots."""
+    date = models.DateField()
+    time_slot = models.CharField(max_length=50)
+    capacity = models.PositiveSmallIntegerField()
+    booked = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['date', 'time_slot'], name='unique_call_slot'),
+            models.CheckConstraint(condition=models.Q(booked__lte=models.F('capacity')), name='call_slot_not_overbooked'),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.time_slot} ({self.booked}/{self.capacity})"
+
+    @property
+    def remaining(self):
+        return max(self.capacity - self.booked, 0)
+
 # ===== CONTACT MESSAGE MODEL =====
 class ContactMessage(models.Model):
     full_name = models.CharField(max_length=100)
@@ -69,5 +257,30 @@ class ContactMessage(models.Model):
     message = models.TextField(max_length=500)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at'], name='contactmessage_created_idx'),
+            # As on ScheduleCall: PostgreSQL only; SQLite uses migration 0018's indexes
+            models.Index(Upper('email'), name='contactmessage_email_idx'),
+            models.Index(Upper('phone'), name='contactmessage_phone_idx'),
+        ]
+
     def __str__(self):
         return f"{self.full_name} - {self.subject}"
+
+# ===== LEAD EXPORT CURSOR =====
+class LeadExportCursor(models.Model):
+    """Highest lead id already exported under ``name``; see website.exports."""
+    name = models.CharField(max_length=100, unique=True)
+    last_id = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} @ {self.last_id}"
+
+    def advance(self, last_id):
+        # Conditional so two overlapping exports can never move the cursor back.
+        LeadExportCursor.objects.filter(pk=self.pk, last_id__lt=last_id).update(
+            last_id=last_id, updated_at=timezone.now(),
+        )
+        self.last_id = max(self.last_id, last_id)
@@ -0,0 +1,171 @@
+import base64
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+
+# ===== CURSOR ENCODING =====
+def encode_cursor(values, direction):
+    payload = json.dumps({'k': list(values), 'd': direction}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, fields=()):
+    """Return ``(values, direction)`` or ``(None, 'next')`` for a bad cursor.
+
+    When ``fields`` (the ordering's model fields) are given, each value is
+    cleaned by its field, so a tampered cursor such as ``["abc", 1]`` or an
+    out-of-range integer falls back to page 1 instead of failing the query.
+    """
+    if not cursor:
+        return None, 'next'
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values, direction = data['k'], data['d']
+        if direction not in ('next', 'prev') or not isinstance(values, list):
+            raise ValueError(direction)
+        if fields:
+            if len(values) != len(fields):
+                raise ValueError(values)
+            values = [field.clean(value, None) for field, value in zip(fields, values)]
+        return values, direction
+    except (ValueError, KeyError, TypeError, ValidationError):
+        return None, 'next'
+
+
+def get_page_size(request):
+    """Page size from ``?page_size=``, capped by ``BANQUET_MAX_PAGE_SIZE``."""
+    try:
+        size = int(request.GET.get('page_size', settings.BANQUET_PAGE_SIZE))
+    except (TypeError, ValueError):
+        size = settings.BANQUET_PAGE_SIZE
+    return max(1, min(size, settings.BANQUET_MAX_PAGE_SIZE))
+
+
+# ===== KEYSET PAGINATION =====
+class KeysetPage:
+    def __init__(self, items, next_cursor, prev_cursor):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.prev_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+class KeysetPaginator:
+    """Seek-based pagination over a two-column ordering, ``(capacity, id)`` by default.
+
+    Every page is a ``WHERE (a, b) > (x, y) ORDER BY a, b LIMIT n`` index seek,
+    so page 500 costs the same as page 1. Rows may be model instances or
+    ``.values()`` dicts.
+    """
+
+    def __init__(self, queryset, page_size, keys=('capacity', 'id')):
+        self.queryset = queryset
+        self.page_size = page_size
+        self.keys = keys
+
+    def _key_of(self, row):
+        if isinstance(row, dict):
+            return [row[k] for k in self.keys]
+        return [getattr(row, k) for k in self.keys]
+
+    def _seek(self, values, forward):
+        first, second = self.keys
+        op = 'gt' if forward else 'lt'
+        # Written as ``a >= x AND (a > x OR b > y)`` so the leading column stays an index range.
+        return Q(**{f'{first}__{op}e': values[0]}) & (
+            Q(**{f'{first}__{op}': values[0]}) | Q(**{f'{second}__{op}': values[1]})
+        )
+
+    def _window(self, cursor):
+        """``(queryset, cursor values, forward)`` for one page plus a look-ahead row."""
+        fields = [self.queryset.model._meta.get_field(k) for k in self.keys]
+        values, direction = decode_cursor(cursor, fields)
+        forward = direction == 'next'
+
+        queryset = self.queryset
+        if values is not None:
+            queryset = queryset.filter(self._seek(values, forward))
+        ordering = self.keys if forward else [f'-{k}' for k in self.keys]
+        return queryset.order_by(*ordering)[:self.page_size + 1], values, forward
+
+    def _build(self, rows, values, forward):
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if not forward:
+            rows.reverse()
+
+        next_cursor = prev_cursor = None
+        if rows:
+            if has_more or not forward:
+                next_cursor = encode_cursor(self._key_of(rows[-1]), 'next')
+            if values is not None and (forward or has_more):
+                prev_cursor = encode_cursor(self._key_of(rows[0]), 'prev')
+        return KeysetPage(rows, next_cursor, prev_cursor)
+
+    def page(self, cursor=None):
+        queryset, values, forward = self._window(cursor)
+        return self._build(list(queryset), values, forward)
+
+    async def apage(self, cursor=None):
+        """Async :meth:`page`; rows (and any prefetches) are fetched with ``aiterator``."""
+        queryset, values, forward = self._window(cursor)
+        rows = [row async for row in queryset.aiterator(chunk_size=self.page_size + 1)]
+        return self._build(rows, values, forward)
+
+
+# ===== ADMIN COUNTS =====
+def estimated_row_count(model, using='default'):
+    """Planner row estimate for ``model``'s table, or None where the backend has none."""
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass', [model._meta.db_table])
+        row = cursor.fetchone()
+    return row[0] if row and row[0] >= 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """Admin paginator that never runs an unbounded ``COUNT(*)``.
+
+    Rows are counted only up to ``exact_limit`` past the requested page
+    (``page_hint``), so the page links always reach further than the last
+    one shown and every row stays reachable. An unfiltered changelist larger
+    than that reports the planner's estimate where the backend has one.
+    """
+    exact_limit = 10000
+
+    def __init__(self, *args, page_hint=1, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.page_hint = max(page_hint, 1)
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        bound = self.page_hint * self.per_page + self.exact_limit
+        counted = queryset.order_by()[:bound].count()
+        if counted == bound and not queryset.query.where:
+            estimate = estimated_row_count(queryset.model, queryset.db)
+            if estimate is not None:
+                return max(estimate, counted)
+        return counted
@@ -0,0 +1,127 @@
+import hashlib
+import re
+from decimal import Decimal
+
+from django.core.exceptions import BadRequest
+from django.core.files.storage import default_storage
+from django.db.models import OuterRef, Subquery
+
+from .areas import area_key
+from .availability import available_on
+
+# Columns returned by the JSON search API (read with .values(), no model instances)
+SEARCH_FIELDS = ('id', 'banquet_name', 'location', 'capacity', 'price', 'services', 'google_link')
+
+# Grouping separators and currency marks; the decimal point is kept.
+_NUMBER_NOISE = re.compile(r"[\s,'_₹$]|\b(?:rs|inr)\.?", re.IGNORECASE)
+_NUMBER = re.compile(r'\d+(?:\.\d*)?|\.\d+')
+
+# Largest filter values the columns can hold: Banquet.capacity is an
+# IntegerField, Banquet.price a DecimalField(max_digits=10, decimal_places=2).
+MAX_GUESTS = 2**31 - 1
+MAX_BUDGET = Decimal('99999999.99')
+
+
+def _to_decimal(value):
+    """Parse user numbers such as "50,000", "₹ 2500" or "2500.50"; None when
+    empty or not a number."""
+    number = _NUMBER_NOISE.sub('', str(value or ''))
+    return Decimal(number) if _NUMBER.fullmatch(number) else None
+
+
+def _to_int(value):
+    number = _to_decimal(value)
+    return None if number is None else int(number)
+
+
+# ===== BANQUET SEARCH =====
+def search_banquets(queryset, area=None, guests=None, min_budget=None, max_budget=None, date=None):
+    """Apply the landing page filters.
+
+    Area plus guests is served by the (location_key, capacity) index; a
+    budget range by the (location_key, price) and (price) indexes; a date
+    by a NOT EXISTS seek on the booking interval index.
+    """
+    if area:
+        queryset = queryset.filter(location_key=area_key(area))
+    guests = _to_int(guests)
+    if guests:
+        queryset = queryset.filter(capacity__gte=guests)
+    min_budget, max_budget = _to_decimal(min_budget), _to_decimal(max_budget)
+    if min_budget:
+        queryset = queryset.filter(price__gte=min_budget)
+    if max_budget:
+        queryset = queryset.filter(price__lte=max_budget)
+    if date:
+        queryset = available_on(queryset, date)
+    return queryset
+
+
+def serialize_banquet(banquet):
+    """Public fields of a listing for the AJAX/JSON responses."""
+    cover = banquet.cover_image
+    return {
+        'id': banquet.id,
+        'banquet_name': banquet.banquet_name,
+        'location': banquet.location,
+        'capacity': banquet.capacity,
+        'price': banquet.price,
+        'services': banquet.services or '',
+        'google_link': banquet.google_link or '',
+        'cover_image': cover.card_url if cover else '',
+        'cover_srcset': cover.srcset if cover else '',
+        'images_processing': bool(cover and cover.is_processing),
+    }
+
+
+# ===== JSON SEARCH API =====
+def search_params(request):
+    """Normalized filters from the landing search form (``city`` is an alias of ``area``).
+
+    The form's ``event_type`` is not a filter: listings have no event data
+    to match it against, so it is left out of cache keys and ETags too.
+    Raises ``BadRequest`` for numbers larger than the columns can hold.
+    """
+    params = {
+        'area': area_key(request.GET.get('area') or request.GET.get('city') or ''),
+        'date': request.GET.get('date', ''),
+        'cursor': request.GET.get('cursor', ''),
+        'page_size': request.GET.get('page_size', ''),
+    }
+    for name in ('guests', 'budget', 'min_budget', 'max_budget'):
+        number = _to_decimal(request.GET.get(name))
+        if number is not None and number > (MAX_GUESTS if name == 'guests' else MAX_BUDGET):
+            raise BadRequest(f"{name} is out of range.")
+        params[name] = number
+    params['guests'] = _to_int(params['guests'])
+    # The landing form's single "Budget" box is an upper bound
+    budget = params.pop('budget')
+    params['max_budget'] = params['max_budget'] or budget
+    return params
+
+
+def search_etag(params, version):
+    """ETag for a search result page: changes when any listing changes.
+
+    ``version`` must come from the shared cache (see website.cache) so every
+    worker stops answering 304 as soon as any of them sees a write.
+    """
+    raw = repr((version, sorted(params.items())))
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+def attach_cover_urls(rows, image_model):
+    """Add a ``cover`` URL to ``.values()`` rows with one extra query."""
+    if not rows:
+        return rows
+    first_image = image_model.objects.filter(banquet=OuterRef('banquet')).order_by('id').values('id')[:1]
+    covers = {
+        banquet_id: card or image
+        for banquet_id, card, image in image_model.objects.filter(
+            banquet_id__in=[row['id'] for row in rows], id=Subquery(first_image),
+        ).values_list('banquet_id', 'card_image', 'image')
+    }
+    for row in rows:
+        name = covers.get(row['id'])
+        row['cover'] = default_storage.url(name) if name else ''
+    return rows
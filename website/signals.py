@@ -0,0 +1,81 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .cache import bump_listing_version
+from .availability import booking_years, rebuild_calendar
+from .facets import ensure_facet_state, record_banquet_deleted, record_banquet_saved
+from .models import Banquet, BanquetBooking, BanquetImage, ScheduleCall
+from .slots import release_slot
+from .timing import record_query
+
+
+# ===== LISTING CACHE INVALIDATION =====
+@receiver(post_save, sender=Banquet)
+@receiver(post_delete, sender=Banquet)
+@receiver(post_save, sender=BanquetImage)
+@receiver(post_delete, sender=BanquetImage)
+@receiver(post_save, sender=BanquetBooking)
+@receiver(post_delete, sender=BanquetBooking)
+def invalidate_listing_cache(sender, **kwargs):
+    # After commit, so a concurrent request can't re-cache the old rows
+    transaction.on_commit(bump_listing_version)
+
+
+# ===== AREA FACETS =====
+@receiver(pre_save, sender=Banquet)
+@receiver(pre_delete, sender=Banquet)
+def snapshot_facet_state(sender, instance, **kwargs):
+    ensure_facet_state(instance)
+
+
+@receiver(post_save, sender=Banquet)
+def update_facets_on_save(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        record_banquet_saved(instance, created)
+
+
+@receiver(post_delete, sender=Banquet)
+def update_facets_on_delete(sender, instance, **kwargs):
+    record_banquet_deleted(instance)
+
+
+# ===== AVAILABILITY CALENDAR =====
+@receiver(post_save, sender=BanquetBooking)
+@receiver(post_delete, sender=BanquetBooking)
+def refresh_calendar(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    years = list(booking_years(instance.start_date, instance.end_date))
+    old_start, old_end = getattr(instance, '_loaded_range', (None, None))
+    if old_start and old_end:
+        years += booking_years(old_start, old_end)
+    rebuild_calendar(instance.banquet_id, years)
+    instance._loaded_range = (instance.start_date, instance.end_date)
+
+
+# ===== CALL SLOTS =====
+@receiver(post_delete, sender=ScheduleCall)
+def free_call_slot(sender, instance, **kwargs):
+    release_slot(instance.date, instance.time_slot)
+
+
+# ===== SQLITE PRAGMAS =====
+@receiver(connection_created)
+def configure_sqlite(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for name, value in getattr(settings, 'SQLITE_PRAGMAS', {}).items():
+            cursor.execute(f'PRAGMA {name}={value}')
+
+
+# ===== QUERY TIMING =====
+@receiver(connection_created)
+def install_query_timer(sender, connection, **kwargs):
+    # Permanent rather than per request: under ASGI the view's queries run
+    # on a sync_to_async thread whose connection the middleware can't reach.
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
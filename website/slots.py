@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.db.models import F
+
+from .models import CallSlot
+
+
+# ===== RESERVATIONS =====
+def reserve_slot(date, time_slot):
+    """Take one place in a call slot; returns False when the slot is full.
+
+    The check and the increment are a single conditional UPDATE
+    (``booked < capacity``), so concurrent requests can never overbook.
+    """
+    CallSlot.objects.get_or_create(
+        date=date, time_slot=time_slot, defaults={'capacity': settings.CALL_SLOT_CAPACITY},
+    )
+    updated = CallSlot.objects.filter(
+        date=date, time_slot=time_slot, booked__lt=F('capacity'),
+    ).update(booked=F('booked') + 1)
+    return updated == 1
+
+
+def release_slot(date, time_slot):
+    CallSlot.objects.filter(date=date, time_slot=time_slot, booked__gt=0).update(booked=F('booked') - 1)
+
+
+# ===== CAPACITY LOOKUP =====
+def remaining_capacity(start, end):
+    """``{date: {time_slot: remaining}}`` for slots with bookings, in one query.
+
+    Slots missing from the result have the full ``CALL_SLOT_CAPACITY``.
+    """
+    remaining = {}
+    rows = CallSlot.objects.filter(date__range=(start, end)).values_list('date', 'time_slot', 'capacity', 'booked')
+    for date, time_slot, capacity, booked in rows:
+        remaining.setdefault(date.isoformat(), {})[time_slot] = max(capacity - booked, 0)
+    return remaining
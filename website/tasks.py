@@ -0,0 +1,76 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from .cache import bump_listing_version
+from .images import generate_variants
+from .models import BanquetImage
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.IMAGE_WORKER_THREADS,
+            thread_name_prefix='banquet-images',
+        )
+    return _executor
+
+
+# ===== IMAGE PROCESSING JOB =====
+def process_image(image_id, claim_from=(BanquetImage.Status.PENDING,)):
+    """Decode, strip and resize one upload; returns True when it ended ready.
+
+    The row is claimed with a conditional UPDATE, so a thread-pool job and
+    the ``process_images`` worker command never process the same image twice.
+    """
+    claimed = BanquetImage.objects.filter(id=image_id, status__in=claim_from).update(
+        status=BanquetImage.Status.PROCESSING,
+    )
+    if not claimed:
+        return False
+
+    try:
+        image = BanquetImage.objects.get(id=image_id)
+        generate_variants(image, strip_original=True)
+    except Exception as e:
+        logger.error(f"Image processing error for BanquetImage {image_id}: {e}")
+        BanquetImage.objects.filter(id=image_id).update(status=BanquetImage.Status.FAILED)
+        return False
+
+    BanquetImage.objects.filter(id=image_id).update(status=BanquetImage.Status.READY)
+    bump_listing_version()  # .update() sends no post_save; cards must drop the "processing" badge
+    return True
+
+
+def _run_in_worker(image_id):
+    try:
+        process_image(image_id)
+    finally:
+        close_old_connections()
+
+
+def enqueue_image_processing(image_ids):
+    """Process images off the request path once the current transaction commits.
+
+    With ``IMAGE_PROCESSING_ASYNC`` disabled the work runs inline instead.
+    Jobs lost to a worker restart stay ``pending`` and are picked up by
+    ``manage.py process_images``.
+    """
+    image_ids = list(image_ids)
+
+    def submit():
+        for image_id in image_ids:
+            if settings.IMAGE_PROCESSING_ASYNC:
+                _get_executor().submit(_run_in_worker, image_id)
+            else:
+                process_image(image_id)
+
+    transaction.on_commit(submit)
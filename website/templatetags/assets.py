@@ -0,0 +1,109 @@
+import json
+import logging
+from functools import lru_cache
+
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from website.assets import BUNDLES, IMAGE_MANIFEST, bundle_path, image_variant_path
+
+logger = logging.getLogger(__name__)
+
+register = template.Library()
+
+_TAGS = {
+    'css': '<link rel="stylesheet" href="{}">',
+    'js': '<script src="{}"></script>',
+}
+_MIME = {'avif': 'image/avif', 'webp': 'image/webp', 'jpg': 'image/jpeg'}
+_missing = set()
+
+
+def _built_url(path):
+    """URL of a ``build_assets`` output, or None when the static manifest lacks it.
+
+    Manifest storage raises for unknown files, so a deploy that skipped
+    ``build_assets`` would turn every page into a 500; the tags fall back to
+    the source files instead and log the first miss of each path.
+    """
+    try:
+        return static(path)
+    except ValueError:
+        if path not in _missing:
+            _missing.add(path)
+            logger.error(f"{path} is not in the static manifest; serving sources. Run build_assets before collectstatic.")
+        return None
+
+
+@register.simple_tag
+def bundle(page, kind):
+    """Link a page's CSS or JS: one built bundle, or its sources when ASSET_BUNDLES is off."""
+    url = settings.ASSET_BUNDLES and _built_url(bundle_path(page, kind))
+    if url:
+        return format_html(_TAGS[kind], url)
+    return format_html_join('\n', _TAGS[kind], ((static(path),) for path in BUNDLES[page][kind]))
+
+
+@lru_cache(maxsize=None)
+def _built_images():
+    """IMAGE_MANIFEST as written by ``build_assets``; empty before the first build."""
+    path = finders.find(IMAGE_MANIFEST)
+    if not path and staticfiles_storage.exists(IMAGE_MANIFEST):
+        path = staticfiles_storage.path(IMAGE_MANIFEST)
+    if not path:
+        return {}
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def _srcsets(path, record):
+    """``{ext: srcset}`` for every built variant, or None if any is missing from the manifest."""
+    srcsets = {}
+    for ext in record['formats']:
+        urls = [_built_url(image_variant_path(path, width, ext)) for width in record['widths']]
+        if None in urls:
+            return None
+        srcsets[ext] = ', '.join(f'{url} {width}w' for url, width in zip(urls, record['widths']))
+    return srcsets
+
+
+@register.simple_tag
+def picture(path, alt, sizes='100vw', loading='lazy', defer=False, **attrs):
+    """``<picture>`` with AVIF/WebP/JPEG srcsets built by ``build_assets``.
+
+    ``loading='eager'`` also sets ``fetchpriority="high"`` (use it for the LCP
+    image). With ``defer`` the sources go into ``data-src``/``data-srcset``
+    for a script to fill in later. Sizes and formats come from IMAGE_MANIFEST.
+    Without ASSET_BUNDLES, or when any variant was not built, this is a plain
+    ``<img>`` of the original file.
+    """
+    record = _built_images().get(path) if settings.ASSET_BUNDLES else None
+    src_attr, srcset_attr = ('data-src', 'data-srcset') if defer else ('src', 'srcset')
+    size = {'width': record['width'], 'height': record['height']} if record else {}
+    img_attrs = {'alt': alt, **size, 'loading': loading, 'decoding': 'async', **attrs}
+    if loading == 'eager':
+        img_attrs['fetchpriority'] = 'high'
+
+    srcsets = record and _srcsets(path, record)
+    if not srcsets:
+        img_attrs[src_attr] = static(path)
+        return format_html('<img{}>', _attrs(img_attrs))
+
+    sources = format_html_join(
+        '', '<source type="{}" {}="{}" sizes="{}">',
+        ((_MIME[ext], srcset_attr, srcset, sizes) for ext, srcset in srcsets.items() if ext != 'jpg'),
+    )
+    img_attrs.update({
+        src_attr: _built_url(image_variant_path(path, record['widths'][-1], 'jpg')),
+        srcset_attr: srcsets['jpg'],
+        'sizes': sizes,
+    })
+    return format_html('<picture>{}<img{}></picture>', sources, _attrs(img_attrs))
+
+
+def _attrs(attrs):
+    return format_html_join('', ' {}="{}"', attrs.items())
@@ -1,3 +1,518 @@
-from django.test import TestCase
+import json
+import logging
+import tempfile
+from datetime import date, timedelta
+from decimal import Decimal
+from io import BytesIO, StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image as PILImage
+
+from Banquet.workers import AccessLogMiddleware
+
+from .admin import ContactMessageAdmin
+from .areas import resolve_area
+from .assets import bundle_css, minify_js
+from .cache import cache_stats
+from .facets import rebuild_facets
+from .images import IMAGE_VARIANTS, generate_variants
+from .models import AreaFacet, Banquet, BanquetBooking, BanquetCalendar, BanquetImage, ContactMessage, ScheduleCall
+from .pagination import EstimatedCountPaginator, encode_cursor
+from .search import search_banquets, search_params
+from .tasks import process_image
+
+
+# ===== LISTING QUERY COUNT =====
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+class BanquetListingQueryTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner', password='pass12345')
+
+    def make_banquets(self, count, images_each=3):
+        for i in range(count):
+            banquet = Banquet.objects.create(
+                owner=self.owner, owner_name='Owner', banquet_name=f'Hall {i}',
+                email='hall@example.com', phone='9999999999', capacity=100 + i, location='Barra',
+            )
+            for j in range(images_each):
+                BanquetImage.objects.create(banquet=banquet, image=f'banquet_images/{i}_{j}.jpg')
+
+    def count_listing_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_for_listing_fetches_owner_and_cover_in_two_queries(self):
+        self.make_banquets(5)
+        with self.assertNumQueries(2):
+            banquets = list(Banquet.objects.for_listing())
+            for banquet in banquets:
+                banquet.owner.username
+                self.assertEqual(banquet.cover_image.image.name, f'banquet_images/{banquet.banquet_name[5:]}_0.jpg')
+
+    def test_listing_query_count_is_constant(self):
+        url = reverse('banquet')
+        self.make_banquets(2)
+        few = self.count_listing_queries(url)
+        self.make_banquets(10)
+        many = self.count_listing_queries(url)
+        self.assertEqual(few, many)
+
+        url = reverse('landing') + '?area=barra&guests=50'
+        self.assertEqual(self.count_listing_queries(url), few + 1)  # plus the single facet read
+
+    def test_tampered_cursor_falls_back_to_first_page(self):
+        self.make_banquets(2, images_each=0)
+        for values in (['abc', 1], [10 ** 30, 1], [None, 1], [1]):
+            cursor = encode_cursor(values, 'next')
+            for name in ('landing', 'banquet', 'banquet_search_api'):
+                response = self.client.get(reverse(name), {'cursor': cursor})
+                self.assertEqual(response.status_code, 200, (name, values))
+
+
+# ===== BANQUET IMAGES =====
+def jpeg_upload(name, size=(640, 480), **save_options):
+    buffer = BytesIO()
+    PILImage.new('RGB', size, (200, 120, 40)).save(buffer, 'JPEG', **save_options)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/jpeg')
+
+
+class BanquetImageTests(TestCase):
+    def setUp(self):
+        self.enterContext(override_settings(MEDIA_ROOT=self.enterContext(tempfile.TemporaryDirectory())))
+        self.owner = User.objects.create_user(username='owner', password='pass12345')
+        self.banquet = Banquet.objects.create(
+            owner=self.owner, owner_name='Owner', banquet_name='Hall',
+            email='hall@example.com', phone='9999999999', capacity=100, location='Barra',
+        )
+
+    def add_image(self, upload):
+        return BanquetImage.objects.create(banquet=self.banquet, image=upload)
+
+    def test_variants_are_resized_without_exif(self):
+        exif = PILImage.Exif()
+        exif[0x010F] = 'CameraMaker'  # Make
+        image = self.add_image(jpeg_upload('hall.jpg', (3000, 1000), exif=exif))
+        generate_variants(image)
+
+        image.refresh_from_db()
+        sizes = {}
+        for field in IMAGE_VARIANTS:
+            with PILImage.open(getattr(image, field).path) as variant:
+                sizes[field] = variant.size
+                self.assertFalse(variant.getexif())
+        self.assertEqual(sizes, {'thumbnail': (150, 100), 'card_image': (480, 320), 'hero_image': (1600, 533)})
+        self.assertIn('150w', image.srcset)
+
+    def test_processing_moves_pending_images_to_ready_or_failed(self):
+        good = self.add_image(jpeg_upload('good.jpg'))
+        broken = self.add_image(SimpleUploadedFile('broken.jpg', b'not an image', content_type='image/jpeg'))
+        self.assertTrue(good.is_processing)
+
+        self.assertTrue(process_image(good.id))
+        self.assertFalse(process_image(good.id))  # only pending rows are claimed
+        with self.assertLogs('website.tasks', 'ERROR'):
+            self.assertFalse(process_image(broken.id))
+        statuses = dict(BanquetImage.objects.values_list('id', 'status'))
+        self.assertEqual(statuses, {good.id: 'ready', broken.id: 'failed'})
+        good.refresh_from_db()
+        self.assertTrue(good.image.name.endswith('.jpg') and good.thumbnail)
+
+    def test_registration_inserts_all_images_in_a_few_queries(self):
+        self.client.force_login(self.owner)
+        data = {
+            'banquet_name': 'Big Hall', 'email': 'big@example.com', 'phone': '9999999999',
+            'capacity': 300, 'location': 'Barra',
+            'image': [jpeg_upload(f'{i}.jpg', (40, 30)) for i in range(20)],
+        }
+        # session, user, savepoint, banquet, area facet (2), one image INSERT, release
+        with self.assertNumQueries(8):
+            response = self.client.post(reverse('register_banquet'), data)
+        self.assertRedirects(response, reverse('landing'), fetch_redirect_response=False)
+        self.assertEqual(BanquetImage.objects.filter(banquet__banquet_name='Big Hall').count(), 20)
+
+
+# ===== LISTING CACHE =====
+class ListingCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username='owner', password='pass12345')
+        self.banquet = Banquet.objects.create(
+            owner=self.owner, owner_name='Owner', banquet_name='Hall',
+            email='hall@example.com', phone='9999999999', capacity=100, location='Barra',
+        )
+
+    def test_normalized_params_share_an_entry_and_writes_invalidate(self):
+        url = reverse('landing')
+        with self.assertNumQueries(3):
+            self.client.get(url, {'area': 'Barra', 'guests': '50'})
+        with self.assertNumQueries(0):
+            response = self.client.get(url, {'area': ' barra ', 'guests': '050'})
+        self.assertContains(response, 'Hall')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.banquet.banquet_name = 'Renamed Hall'
+            self.banquet.save()
+        self.assertContains(self.client.get(url, {'area': 'Barra', 'guests': '50'}), 'Renamed Hall')
+
+    def test_stats_come_from_the_metrics_counters(self):
+        before = cache_stats()
+        for _ in range(2):
+            self.client.get(reverse('landing'))
+        stats = cache_stats()
+        self.assertEqual((stats['hits'] - before['hits'], stats['misses'] - before['misses']), (1, 1))
+        self.assertIsNone(cache.get('listing:hits'))
+
+    def test_search_etag_changes_after_a_write(self):
+        url = reverse('banquet_search_api')
+        etag = self.client.get(url, {'area': 'Barra'})['ETag']
+        not_modified = self.client.get(url, {'area': 'Barra'}, headers={'If-None-Match': etag})
+        self.assertEqual((not_modified.status_code, not_modified['ETag']), (304, etag))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.banquet.capacity = 500
+            self.banquet.save()
+        response = self.client.get(url, {'area': 'Barra'}, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'][0]['capacity'], 500)
+
+    def test_cached_header_keeps_the_active_button(self):
+        self.client.get(reverse('landing'))
+        self.assertContains(self.client.get(reverse('schedule_call')), 'class="schedule-call active"')
+        self.assertNotContains(self.client.get(reverse('about')), 'schedule-call active')
+
+    def test_budget_parsing_keeps_the_decimal_point(self):
+        get = lambda **query: search_params(RequestFactory().get('/', query))
+        self.assertEqual(get(budget='2500.50')['max_budget'], Decimal('2500.50'))
+        self.assertEqual(get(min_budget='₹ 1,20,000', guests='Rs.50')['min_budget'], 120000)
+        self.assertIsNone(get(budget='2.500.50')['max_budget'])
+        self.assertIsNone(get(guests='fifty')['guests'])
+
+        Banquet.objects.filter(pk=self.banquet.pk).update(price=Decimal('2500.25'))
+        response = self.client.get(reverse('banquet_search_api'), {'budget': '2500.50'})
+        self.assertEqual([row['id'] for row in response.json()['results']], [self.banquet.pk])
+
+    def test_out_of_range_numbers_are_a_bad_request(self):
+        for query in ({'budget': '1' * 20}, {'guests': '3000000000'}):
+            self.assertEqual(self.client.get(reverse('banquet_search_api'), query).status_code, 400)
+            self.assertEqual(self.client.get(reverse('landing'), query).status_code, 400)
+        self.assertEqual(self.client.get(reverse('about'), {'budget': '1' * 20}).status_code, 200)
+
+
+# ===== AREA FACETS =====
+class AreaFacetTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner', password='pass12345')
+
+    def make_banquet(self, location, capacity):
+        return Banquet.objects.create(
+            owner=self.owner, owner_name='Owner', banquet_name='Hall',
+            email='hall@example.com', phone='9999999999', capacity=capacity, location=location,
+        )
+
+    def facet_rows(self):
+        return list(AreaFacet.objects.filter(venue_count__gt=0).order_by('area_key').values(
+            'area_key', 'venue_count', 'capacity_0_100', 'capacity_101_300', 'capacity_over_1000',
+        ))
+
+    def test_incremental_updates_match_rebuild(self):
+        a = self.make_banquet('Barra', 80)
+        b = self.make_banquet('barra', 250)
+        self.make_banquet('Kidwai Nagar', 1500)
+        b.capacity = 2000
+        b.save()
+        a.location = 'Kidwai Nagar'
+        Banquet.objects.get(pk=a.pk).delete()
+
+        incremental = self.facet_rows()
+        rebuild_facets()
+        self.assertEqual(incremental, self.facet_rows())
+        self.assertEqual(incremental, [
+            {'area_key': 'barra', 'venue_count': 1, 'capacity_0_100': 0, 'capacity_101_300': 0, 'capacity_over_1000': 1},
+            {'area_key': 'kidwai nagar', 'venue_count': 1, 'capacity_0_100': 0, 'capacity_101_300': 0, 'capacity_over_1000': 1},
+        ])
+
+
+# ===== AREA RESOLUTION =====
+class AreaResolutionTests(TestCase):
+    def test_resolves_variants_to_canonical_area(self):
+        cases = {
+            'barra': 'Barra',
+            'Barra 2': 'Barra',
+            'Birhana Road': 'Birhana Raod',
+            'Kanpur Cantt': 'Kanpur Cantt.',
+            '12 Mall Road, Swarup Nagar, Kanpur': 'Swarup Nagar',
+            'somewhere else entirely': None,
+        }
+        for text, expected in cases.items():
+            self.assertEqual(resolve_area(text), expected, text)
+
+    def test_search_matches_misspelt_area(self):
+        owner = User.objects.create_user(username='owner', password='pass12345')
+        banquet = Banquet.objects.create(
+            owner=owner, owner_name='Owner', banquet_name='Hall',
+            email='hall@example.com', phone='9999999999', capacity=100, location='Birhana Road',
+        )
+        self.assertEqual(banquet.location_key, 'birhana raod')
+        self.assertEqual(list(search_banquets(Banquet.objects.all(), area='birhana raod')), [banquet])
+
+
+# ===== AVAILABILITY =====
+class AvailabilityTests(TestCase):
+    def setUp(self):
+        owner = User.objects.create_user(username='owner', password='pass12345')
+        self.banquet = Banquet.objects.create(
+            owner=owner, owner_name='Owner', banquet_name='Hall',
+            email='hall@example.com', phone='9999999999', capacity=300, location='Barra',
+        )
+
+    def test_booked_banquet_is_excluded_on_that_date(self):
+        BanquetBooking.objects.create(banquet=self.banquet, start_date=date(2026, 12, 30), end_date=date(2027, 1, 2))
+        search = lambda day: list(search_banquets(Banquet.objects.all(), area='Barra', guests=200, date=day))
+        self.assertEqual(search('2026-12-31'), [])
+        self.assertEqual(search('2027-01-02'), [])
+        self.assertEqual(search('2027-01-03'), [self.banquet])
+
+    def test_calendar_bitmap_follows_booking_changes(self):
+        booking = BanquetBooking.objects.create(banquet=self.banquet, start_date=date(2026, 3, 1), end_date=date(2026, 3, 3))
+        response = self.client.get(reverse('banquet_calendar_api', args=[self.banquet.pk]), {'year': 2026})
+        self.assertEqual(response.json()['booked'][2], 0b111)
+        self.assertEqual(response.json()['booked_days']['3'], [1, 2, 3])
+
+        booking = BanquetBooking.objects.get(pk=booking.pk)
+        booking.start_date, booking.end_date = date(2027, 5, 10), date(2027, 5, 10)
+        booking.save()
+        self.assertEqual(BanquetCalendar.objects.get(banquet=self.banquet, year=2026).booked, [0] * 12)
+        self.assertEqual(BanquetCalendar.objects.get(banquet=self.banquet, year=2027).booked[4], 1 << 9)
+
+    def test_calendar_rejects_years_outside_the_calendar(self):
+        url = reverse('banquet_calendar_api', args=[self.banquet.pk])
+        for year in (0, 10000, 10**30):
+            self.assertEqual(self.client.get(url, {'year': year}).status_code, 400)
+
+
+# ===== CALL SLOTS =====
+@override_settings(CALL_SLOT_CAPACITY=2)
+class CallSlotTests(TestCase):
+    def book(self, name):
+        return self.client.post(reverse('schedule_call'), {
+            'name': name, 'email': f'{name}@example.com', 'phone': '9999999999',
+            'date': '2026-11-02', 'time_slot': '10:00 AM', 'reason': 'Consultation',
+        }, headers={'X-Requested-With': 'XMLHttpRequest'}).json()
+
+    def test_slot_stops_accepting_calls_at_capacity(self):
+        self.assertTrue(self.book('a')['success'])
+        self.assertTrue(self.book('b')['success'])
+        full = self.book('c')
+        self.assertFalse(full['success'])
+        self.assertIn('time_slot', full['errors'])
+        self.assertEqual(ScheduleCall.objects.count(), 2)
+
+        response = self.client.get(reverse('call_slot_capacity_api'), {'start': '2026-11-01', 'end': '2026-11-05'})
+        self.assertEqual(response.json()['remaining'], {'2026-11-02': {'10:00 AM': 0}})
+
+        ScheduleCall.objects.first().delete()
+        self.assertTrue(self.book('d')['success'])
+
+
+# ===== LEAD ADMIN =====
+class LeadAdminTests(TestCase):
+    def setUp(self):
+        admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'pass12345')
+        self.client.force_login(admin_user)
+        for name, email in (('Asha', 'asha@example.com'), ('Ravi', 'ravi@example.com')):
+            ContactMessage.objects.create(full_name=name, email=email, subject='General', message='Hi')
+        ContactMessage.objects.filter(full_name='Ravi').update(created_at=timezone.now() - timedelta(days=400))
+
+    def changelist(self, **params):
+        response = self.client.get(reverse('admin:website_contactmessage_changelist'), params)
+        return [row.full_name for row in response.context['cl'].result_list]
+
+    def test_indexed_search_and_month_filter(self):
+        self.assertEqual(self.changelist(q='ASHA@example.com'), ['Asha'])
+        self.assertEqual(self.changelist(q='rav'), ['Ravi'])
+        self.assertEqual(self.changelist(q='example.com'), [])  # no substring scans
+        self.assertEqual(self.changelist(created=timezone.localdate().strftime('%Y-%m')), ['Asha'])
+        self.assertEqual(self.changelist(), ['Asha', 'Ravi'])
+
+    def test_pages_beyond_the_count_limit_stay_reachable(self):
+        ContactMessage.objects.create(full_name='Meera', email='meera@example.com', subject='General', message='Hi')
+        with mock.patch.object(EstimatedCountPaginator, 'exact_limit', 1), \
+                mock.patch.object(ContactMessageAdmin, 'list_per_page', 1):
+            self.assertEqual(self.changelist(p=3), ['Ravi'])
+
+    def export_new(self):
+        # Neither the filter nor the one selected row narrows the export
+        response = self.client.post(reverse('admin:website_contactmessage_changelist') + '?created=7d', {
+            'action': 'export_new_csv', 'select_across': '0', 'index': '0',
+            '_selected_action': [ContactMessage.objects.first().pk],
+        })
+        return [line.split(',')[1] for line in b''.join(response.streaming_content).decode().splitlines()[1:]]
+
+    def test_incremental_export_only_streams_new_leads(self):
+        self.assertEqual(self.export_new(), ['Asha', 'Ravi'])
+        self.assertEqual(self.export_new(), [])
+        ContactMessage.objects.create(full_name='Meera', email='meera@example.com', subject='General', message='Hi')
+        self.assertEqual(self.export_new(), ['Meera'])
+
+
+# ===== BANQUET IMPORT =====
+class BanquetImportTests(TestCase):
+    HEADER = 'external_ref,banquet_name,email,phone,capacity,location\n'
+
+    def setUp(self):
+        self.owner = User.objects.create_user(username='partner', password='pass12345')
+
+    def run_import(self, lines):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv') as file:
+            file.write(self.HEADER + ''.join(lines))
+            file.flush()
+            call_command('import_banquets', file.name, owner='partner', stdout=StringIO(), stderr=StringIO())
+        return {b.external_ref: (b.capacity, b.location) for b in Banquet.objects.all()}
+
+    def test_rows_are_validated_normalized_and_upserted(self):
+        imported = self.run_import([
+            'A1,Hall A,a@example.com,9999999999,80,barra 2\n',
+            'A2,Hall B,not-an-email,9999999999,80,Barra\n',
+            'A3,Hall C,c@example.com,9999999999,80,Atlantis\n',
+            f'{"A" * 101},Hall D,d@example.com,9999999999,80,Barra\n',
+        ])
+        self.assertEqual(imported, {'A1': (80, 'Barra')})
+
+        imported = self.run_import(['A1,Hall A,a@example.com,9999999999,500,Barra\n'])
+        self.assertEqual(imported, {'A1': (500, 'Barra')})
+        self.assertEqual(AreaFacet.objects.get(area_key='barra').capacity_301_500, 1)
+
+
+# ===== REQUEST TIMING =====
+class RequestTimingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @override_settings(TIMING_SAMPLE_RATE=0, TIMING_SLOW_QUERIES=1)
+    def test_slow_requests_are_logged_with_query_and_template_timings(self):
+        with CaptureQueriesContext(connection) as ctx, self.assertLogs('website.timing', 'WARNING') as logs:
+            response = self.client.get(reverse('banquet'))
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record['view'], 'banquet')
+        self.assertEqual(record['queries'], len(ctx.captured_queries))
+        self.assertGreater(record['template_ms'], 0)
+        self.assertEqual(record['bytes'], len(response.content))
+        self.assertRegex(response['Server-Timing'], r'^app;dur=[\d.]+, db;dur=[\d.]+;desc="\d+ queries", tpl;dur=[\d.]+$')
+
+    @override_settings(TIMING_SAMPLE_RATE=0)
+    def test_fast_unsampled_requests_are_not_logged(self):
+        with self.assertNoLogs('website.timing'):
+            self.client.get(reverse('about'))
+
+    async def test_uvicorn_access_log_has_the_duration(self):
+        async def app(scope, receive, send):
+            await send({'type': 'http.response.start', 'status': 201, 'headers': []})
+            await send({'type': 'http.response.body', 'body': b'hello'})
+
+        scope = {
+            'type': 'http', 'method': 'GET', 'path': '/x', 'query_string': b'a=1', 'http_version': '1.1',
+            'client': ('10.0.0.1', 5000), 'headers': [(b'user-agent', b'probe')],
+        }
+        with self.assertLogs('test.access') as logs:
+            await AccessLogMiddleware(app, logging.getLogger('test.access'))(scope, None, mock.AsyncMock())
+        self.assertRegex(logs.records[0].getMessage(), r'^10\.0\.0\.1 "GET /x\?a=1 HTTP/1\.1" 201 5B \d+ms "probe"$')
+
+
+# ===== METRICS =====
+@override_settings(METRICS_TOKEN='s3cret')
+class MetricsTests(TestCase):
+    def scrape(self):
+        response = self.client.get(reverse('metrics'), headers={'Authorization': 'Bearer s3cret'})
+        return dict(line.rsplit(' ', 1) for line in response.content.decode().splitlines() if not line.startswith('#'))
+
+    def test_form_outcomes_and_latency_are_counted(self):
+        before = self.scrape()
+        self.client.post(reverse('contact'), {'full_name': 'Asha'})
+        self.client.get(reverse('contact'))
+        after = self.scrape()
+
+        key = 'form_submissions_total{form="contact",outcome="invalid"}'
+        self.assertEqual(int(after[key]) - int(before.get(key, 0)), 1)
+        key = 'http_request_duration_seconds_count{view="contact",status="2xx"}'
+        self.assertEqual(int(after[key]) - int(before.get(key, 0)), 2)
+
+    def test_requires_token_or_staff(self):
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 403)
+
+
+# ===== ASSET BUNDLES =====
+BUILT_IMAGES = {'images/2_pic.jpg': {'width': 800, 'height': 535, 'widths': [480, 800], 'formats': ['webp', 'jpg']}}
+
+
+def manifest_static(missing_prefix):
+    """``static()`` of manifest storage that has no entries starting with ``missing_prefix``."""
+    def lookup(path):
+        if path.startswith(missing_prefix):
+            raise ValueError(f"Missing staticfiles manifest entry for '{path}'")
+        return f'/static/{path}'
+    return lookup
+
+
+class AssetBundleTests(TestCase):
+    def setUp(self):
+        self.enterContext(mock.patch('website.templatetags.assets._missing', set()))  # log every miss
+
+    def test_minify_js_keeps_strings_and_regex_literals(self):
+        source = "// note\nconst re = /^https?:\\/\\//; /* block */\nconst url = 'http://x';  \n\n  go(url);\n"
+        self.assertEqual(minify_js(source), "const re = /^https?:\\/\\//;\nconst url = 'http://x';\ngo(url);")
+
+    def test_css_imports_are_hoisted(self):
+        css = bundle_css(['a { color: red; }', "@import url('https://f.example/css?w=4;7');\nb { margin : 0 }"])
+        self.assertEqual(css, "@import url('https://f.example/css?w=4;7');a{color:red}\nb{margin :0}")
+
+    @override_settings(ASSET_BUNDLES=False)
+    def test_sources_are_linked_in_order_when_bundles_are_off(self):
+        html = Template("{% load assets %}{% bundle 'contact' 'js' %}").render(Context())
+        self.assertEqual(html, '<script src="/static/js/form-utils.js"></script>\n<script src="/static/js/contact.js"></script>')
+
+    @override_settings(ASSET_BUNDLES=True)
+    def test_bundle_is_linked_when_enabled(self):
+        html = Template("{% load assets %}{% bundle 'landing' 'css' %}").render(Context())
+        self.assertEqual(html, '<link rel="stylesheet" href="/static/dist/landing.css">')
+
+    @override_settings(ASSET_BUNDLES=True)
+    @mock.patch('website.templatetags.assets._built_images', lambda: BUILT_IMAGES)
+    def test_deferred_picture_keeps_sources_in_data_attributes(self):
+        html = Template("{% load assets %}{% picture 'images/2_pic.jpg' 'Hall' defer=True %}").render(Context())
+        self.assertIn('data-srcset="/static/dist/images/2_pic-480.webp 480w, /static/dist/images/2_pic-800.webp 800w"', html)
+        self.assertIn('data-src="/static/dist/images/2_pic-800.jpg"', html)
+        self.assertNotIn(' src=', html)
+        self.assertIn('width="800" height="535"', html)
+
+    @override_settings(ASSET_BUNDLES=True)
+    @mock.patch('website.templatetags.assets._built_images', lambda: BUILT_IMAGES)
+    def test_sources_are_linked_when_bundles_were_not_built(self):
+        with mock.patch('website.templatetags.assets.static', manifest_static('dist/')), \
+                self.assertLogs('website.templatetags.assets', 'ERROR'):
+            html = Template(
+                "{% load assets %}{% bundle 'contact' 'js' %}{% picture 'images/2_pic.jpg' 'Hall' %}"
+            ).render(Context())
+        self.assertIn('<script src="/static/js/form-utils.js"></script>\n<script src="/static/js/contact.js"></script>', html)
+        self.assertIn('<img alt="Hall" width="800" height="535"', html)
+        self.assertIn('src="/static/images/2_pic.jpg"', html)
+
+    @override_settings(ASSET_BUNDLES=True)
+    @mock.patch('website.templatetags.assets._built_images', lambda: BUILT_IMAGES)
+    def test_picture_falls_back_when_a_recorded_format_is_missing(self):
+        with mock.patch('website.templatetags.assets.static', manifest_static('dist/images/2_pic-480.webp')), \
+                self.assertLogs('website.templatetags.assets', 'ERROR'):
+            html = Template("{% load assets %}{% picture 'images/2_pic.jpg' 'Hall' %}").render(Context())
+        self.assertTrue(html.startswith('<img alt="Hall" width="800" height="535"'))
+        self.assertNotIn('dist/', html)
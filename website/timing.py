@@ -0,0 +1,81 @@
+from contextvars import ContextVar
+from time import perf_counter
+
+from django.template.backends.django import DjangoTemplates, Template
+
+# ===== REQUEST TIMER =====
+# The timer lives in a context variable rather than on a thread: asgiref
+# copies the context into sync_to_async threads, so queries and template
+# renders of async views are attributed to the right request.
+_current_timer = ContextVar('request_timer', default=None)
+
+
+class RequestTimer:
+    """Wall, database and template time (seconds) for one request."""
+    __slots__ = ('start', 'queries', 'db_time', 'template_time', '_token')
+
+    def __init__(self):
+        self.start = perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+
+    def __enter__(self):
+        self._token = _current_timer.set(self)
+        return self
+
+    def __exit__(self, *exc):
+        _current_timer.reset(self._token)
+
+    @property
+    def elapsed(self):
+        return perf_counter() - self.start
+
+
+def current_timer():
+    return _current_timer.get()
+
+
+# ===== SQL =====
+def record_query(execute, sql, params, many, context):
+    """``connection.execute_wrapper`` hook adding each query to the current timer.
+
+    Installed on every connection (see website.signals); costs one context
+    lookup when no request is being timed.
+    """
+    timer = _current_timer.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+    start = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timer.queries += 1
+        timer.db_time += perf_counter() - start
+
+
+# ===== TEMPLATES =====
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        timer = _current_timer.get()
+        if timer is None:
+            return super().render(context, request)
+        start = perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            timer.template_time += perf_counter() - start
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """DjangoTemplates whose top-level renders count towards the request timer.
+
+    Includes render inside their parent, so nothing is counted twice. Lazy
+    querysets evaluated by a template count as both template and DB time.
+    """
+
+    def from_string(self, template_code):
+        return TimedTemplate(super().from_string(template_code).template, self)
+
+    def get_template(self, template_name):
+        return TimedTemplate(super().get_template(template_name).template, self)
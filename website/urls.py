@@ -23,7 +23,18 @@ urlpatterns = [
 
     # ===== Schedule a Call =====
     path('schedule-call/', views.schedule_call, name='schedule_call'),
+    path('api/schedule-call/capacity', views.call_slot_capacity_api, name='call_slot_capacity_api'),
 
     # ===== Contact Form =====
     path('contact/', views.contact_us, name='contact'),
+
+    # ===== Search API (JSON) =====
+    path('api/banquets/search', views.banquet_search_api, name='banquet_search_api'),
+    path('api/banquets/<int:pk>/calendar', views.banquet_calendar_api, name='banquet_calendar_api'),
+
+    # ===== Cache Stats (staff only) =====
+    path('cache-stats/', views.cache_stats_view, name='cache_stats'),
+
+    # ===== Metrics (staff or METRICS_TOKEN) =====
+    path('metrics', views.metrics_view, name='metrics'),
 ]+ static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
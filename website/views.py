@@ -1,53 +1,199 @@
-from django.shortcuts import render, redirect
+from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import login, logout, authenticate
 from django.contrib import messages
-from django.http import JsonResponse
+from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.csrf import csrf_exempt
-from django.views.decorators.http import require_http_methods
-from django.core.exceptions import ValidationError
+from django.views.decorators.http import require_http_methods, require_GET
+from django.core.exceptions import BadRequest, ValidationError
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.dateparse import parse_date
+from django.utils.http import quote_etag
+import datetime
+import hmac
 import json
 import logging
-from .models import Banquet, BanquetImage, ScheduleCall, ContactMessage
+from asgiref.sync import sync_to_async
+from .models import Banquet, BanquetImage, BanquetCalendar, ScheduleCall, ContactMessage
+from .availability import booked_days
+from .slots import remaining_capacity, reserve_slot
 from .forms import SignUpForm, LoginForm, BanquetForm, ScheduleCallForm, ContactMessageForm
 from .constants import KANPUR_AREAS  # ✅ Predefined areas
+from .search import (
+    SEARCH_FIELDS, attach_cover_urls, search_banquets, search_etag, search_params, serialize_banquet,
+)
+from .facets import area_options
+from .pagination import KeysetPaginator, get_page_size
+from .tasks import enqueue_image_processing
+from .cache import cache_listing_view, cache_stats, listing_version
+from .metrics import FORM_SUBMISSIONS, render_metrics
+from django.contrib.admin.views.decorators import staff_member_required
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# ===== LISTING HELPERS =====
+# The listing views are async: under ASGI a slow client or DB read waits on the
+# event loop instead of holding a whole worker.
+async def _listing_page(request, queryset):
+    paginator = KeysetPaginator(queryset, get_page_size(request))
+    return await paginator.apage(request.GET.get('cursor'))
+
+
+def _listing_json(page):
+    return JsonResponse({
+        'success': True,
+        'results': [serialize_banquet(b) for b in page],
+        'next_cursor': page.next_cursor,
+        'prev_cursor': page.prev_cursor,
+    })
+
+
 # ===== LANDING PAGE =====
-def landing(request):
-    banquets = Banquet.objects.all()
-    area = request.GET.get('area')  
-    guests = request.GET.get('guests')
-
-    if area:
-        banquets = banquets.filter(location__iexact=area)
-    if guests:
-        try:
-            guests_int = int(guests)
-            banquets = banquets.filter(capacity__gte=guests_int)
-        except ValueError:
-            pass
+@cache_listing_view
+async def landing(request):
+    try:
+        params = search_params(request)
+    except BadRequest as e:
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            return JsonResponse({'success': False, 'message': str(e)}, status=400)
+        raise
+    banquets = search_banquets(
+        Banquet.objects.for_listing(),
+        area=params['area'],
+        guests=params['guests'],
+        min_budget=params['min_budget'],
+        max_budget=params['max_budget'],
+        date=params['date'],
+    )
+    page = await _listing_page(request, banquets)
+
+    # AJAX Response
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return _listing_json(page)
 
     context = {
-        'banquets': banquets,
+        'banquets': page.items,
+        'page': page,
         'KANPUR_AREAS': KANPUR_AREAS,
+        'AREA_OPTIONS': area_options,  # called by the template only when its fragment cache misses
+        'listing_version': await sync_to_async(listing_version)(),
         'request': request  # ✅ Add request for template GET values
     }
-    return render(request, 'landing.html', context)
+    return await sync_to_async(render)(request, 'landing.html', context)
 
 
 
 # ===== ABOUT PAGE =====
+@cache_listing_view
 def about(request):
     return render(request, 'about.html')
 
 
 # ===== BANQUET PAGE =====
-def banquet(request):
-    banquets = Banquet.objects.all()
-    return render(request, 'banquet.html', {'banquets': banquets})
+@cache_listing_view
+async def banquet(request):
+    page = await _listing_page(request, Banquet.objects.for_listing())
+
+    # AJAX Response
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return _listing_json(page)
+
+    return await sync_to_async(render)(request, 'banquet.html', {'banquets': page.items, 'page': page})
+
+
+# ===== SEARCH API (JSON) =====
+@require_GET
+async def banquet_search_api(request):
+    try:
+        params = search_params(request)
+    except BadRequest as e:
+        return JsonResponse({'success': False, 'message': str(e)}, status=400)
+    # Checked here rather than with @condition, whose etag_func would run
+    # the cache lookup synchronously on the event loop.
+    etag = quote_etag(search_etag(params, await sync_to_async(listing_version)()))
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        not_modified['ETag'] = etag
+        return not_modified
+
+    rows = search_banquets(
+        Banquet.objects.all(),
+        area=params['area'],
+        guests=params['guests'],
+        min_budget=params['min_budget'],
+        max_budget=params['max_budget'],
+        date=params['date'],
+    )
+    page = await _listing_page(request, rows.values(*SEARCH_FIELDS))
+
+    response = JsonResponse({
+        'results': await sync_to_async(attach_cover_urls)(page.items, BanquetImage),
+        'next_cursor': page.next_cursor,
+        'prev_cursor': page.prev_cursor,
+    })
+    response['ETag'] = etag
+    return response
+
+
+# ===== AVAILABILITY CALENDAR (JSON) =====
+@require_GET
+def banquet_calendar_api(request, pk):
+    banquet = get_object_or_404(Banquet.objects.only('id'), pk=pk)
+    try:
+        year = int(request.GET.get('year', ''))
+    except ValueError:
+        year = timezone.localdate().year
+    if not datetime.MINYEAR <= year <= datetime.MAXYEAR:
+        return JsonResponse(
+            {'success': False, 'message': f'Year must be between {datetime.MINYEAR} and {datetime.MAXYEAR}.'},
+            status=400,
+        )
+    row = BanquetCalendar.objects.filter(banquet=banquet, year=year).values_list('booked', flat=True).first()
+    bitmap = row or [0] * 12
+
+    return JsonResponse({
+        'banquet': banquet.id,
+        'year': year,
+        'booked': bitmap,  # per month, bit (day - 1) set when booked
+        'booked_days': booked_days(bitmap, year),
+    })
+
+
+# ===== CALL SLOT CAPACITY (JSON) =====
+@require_GET
+def call_slot_capacity_api(request):
+    try:
+        start = parse_date(request.GET.get('start', '')) or timezone.localdate()
+        end = parse_date(request.GET.get('end', '')) or start + datetime.timedelta(days=13)
+    except ValueError:
+        return JsonResponse({'success': False, 'message': 'Dates must be YYYY-MM-DD.'}, status=400)
+    end = min(end, start + datetime.timedelta(days=62))  # bounded range
+
+    return JsonResponse({
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        'default_capacity': settings.CALL_SLOT_CAPACITY,
+        'remaining': remaining_capacity(start, end),
+    })
+
+
+# ===== CACHE STATS (staff only) =====
+@staff_member_required
+def cache_stats_view(request):
+    return JsonResponse(cache_stats())
+
+
+# ===== METRICS (Prometheus text) =====
+def metrics_view(request):
+    token = settings.METRICS_TOKEN
+    authorized = token and hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}')
+    if not (authorized or request.user.is_staff):
+        return HttpResponseForbidden()
+    return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
 
 
 # ===== SIGNUP (AJAX Compatible) =====
@@ -74,6 +220,7 @@ def signup_view(request):
                             email=user.email,
                             phone="",
                             capacity=int(venue_capacity),
+                            price=int(venue_price),
                             location=venue_address,
                             google_link="",
                             services=""
@@ -81,6 +228,7 @@ def signup_view(request):
                     except Exception as e:
                         logger.error(f"Banquet creation error: {e}")
 
+                FORM_SUBMISSIONS.inc(form='signup', outcome='success')
                 # AJAX Response
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                     return JsonResponse({
@@ -92,6 +240,7 @@ def signup_view(request):
                 messages.success(request, '✅ Account created successfully!')
                 return redirect('landing')
             else:
+                FORM_SUBMISSIONS.inc(form='signup', outcome='invalid')
                 # AJAX Response for errors
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                     return JsonResponse({
@@ -103,6 +252,7 @@ def signup_view(request):
                 messages.error(request, 'Please correct the errors below.')
         except Exception as e:
             logger.error(f"Signup error: {e}")
+            FORM_SUBMISSIONS.inc(form='signup', outcome='error')
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                 return JsonResponse({
                     'success': False,
@@ -126,6 +276,7 @@ def login_view(request):
                 user = form.get_user()
                 login(request, user)
                 
+                FORM_SUBMISSIONS.inc(form='login', outcome='success')
                 # AJAX Response
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                     return JsonResponse({
@@ -137,6 +288,7 @@ def login_view(request):
                 messages.success(request, '✅ Logged in successfully!')
                 return redirect('landing')
             else:
+                FORM_SUBMISSIONS.inc(form='login', outcome='invalid')
                 # AJAX Response for errors
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                     return JsonResponse({
@@ -148,6 +300,7 @@ def login_view(request):
                 messages.error(request, '⚠ Invalid username or password.')
         except Exception as e:
             logger.error(f"Login error: {e}")
+            FORM_SUBMISSIONS.inc(form='login', outcome='error')
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                 return JsonResponse({
                     'success': False,
@@ -167,23 +320,46 @@ def logout_view(request):
 
 
 # ===== BANQUET REGISTRATION (AJAX Compatible) =====
+def _upload_too_large(request):
+    # Checked before the body is parsed so oversized uploads never hit disk.
+    try:
+        length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        return False
+    return length > settings.BANQUET_MAX_UPLOAD_BYTES + 64 * 1024  # allowance for the text fields
+
+
 @login_required(login_url='login')
 def register_banquet(request):
+    if request.method == 'POST' and _upload_too_large(request):
+        message = 'Upload is too large. Please select fewer or smaller images.'
+        FORM_SUBMISSIONS.inc(form='register_banquet', outcome='invalid')
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            return JsonResponse({'success': False, 'message': message}, status=413)
+        messages.error(request, message)
+        return redirect('register_banquet')
+
     if request.method == 'POST':
         try:
-            form = BanquetForm(request.POST)
+            form = BanquetForm(request.POST, request.FILES)
             files = request.FILES.getlist('image')  # multiple images handle
 
             if form.is_valid():
-                banquet = form.save(commit=False)
-                banquet.owner = request.user
-                banquet.owner_name = request.user.get_full_name() or request.user.username
-                banquet.save()
-
-                # Handle multiple images
-                for f in files:
-                    BanquetImage.objects.create(banquet=banquet, image=f)
-
+                # Banquet + all images commit together: one INSERT for the
+                # banquet and one batched INSERT for its images.
+                with transaction.atomic():
+                    banquet = form.save(commit=False)
+                    banquet.owner = request.user
+                    banquet.owner_name = request.user.get_full_name() or request.user.username
+                    banquet.save()
+
+                    images = BanquetImage.objects.bulk_create(
+                        BanquetImage(banquet=banquet, image=f) for f in files
+                    )
+                    # Resized in the background once the transaction commits
+                    enqueue_image_processing(image.id for image in images)
+
+                FORM_SUBMISSIONS.inc(form='register_banquet', outcome='success')
                 # AJAX Response
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                     return JsonResponse({
@@ -195,6 +371,7 @@ def register_banquet(request):
                 messages.success(request, '✅ Banquet registered successfully with images!')
                 return redirect('landing')
             else:
+                FORM_SUBMISSIONS.inc(form='register_banquet', outcome='invalid')
                 # AJAX Response for errors
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                     return JsonResponse({
@@ -206,6 +383,7 @@ def register_banquet(request):
                 messages.error(request, 'Please correct the errors below.')
         except Exception as e:
             logger.error(f"Banquet registration error: {e}")
+            FORM_SUBMISSIONS.inc(form='register_banquet', outcome='error')
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                 return JsonResponse({
                     'success': False,
@@ -215,20 +393,33 @@ def register_banquet(request):
     else:
         form = BanquetForm()
 
-    return render(request, 'register.html', {'form': form})
+    return render(request, 'register.html', {
+        'form': form,
+        'max_images': settings.BANQUET_MAX_IMAGES,
+        'max_upload_bytes': settings.BANQUET_MAX_UPLOAD_BYTES,
+    })
 
 
 
 
 
 # ===== SCHEDULE CALL (AJAX Compatible) =====
+def _book_call(form):
+    """Save the call if its slot still has room; otherwise flag the slot as full."""
+    with transaction.atomic():
+        if reserve_slot(form.cleaned_data['date'], form.cleaned_data['time_slot']):
+            return form.save()
+    form.add_error('time_slot', 'This time slot is fully booked. Please choose another one.')
+    return None
+
+
 def schedule_call(request):
     if request.method == 'POST':
         try:
             form = ScheduleCallForm(request.POST)
-            if form.is_valid():
-                call = form.save()
-                
+            call = form.is_valid() and _book_call(form)
+            if call:
+                FORM_SUBMISSIONS.inc(form='schedule_call', outcome='success')
                 # AJAX Response
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                     return JsonResponse({
@@ -239,6 +430,7 @@ def schedule_call(request):
                 messages.success(request, f"✅ Your call has been scheduled for {call.date} at {call.time_slot}.")
                 return redirect('landing')
             else:
+                FORM_SUBMISSIONS.inc(form='schedule_call', outcome='invalid')
                 # AJAX Response for errors
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                     return JsonResponse({
@@ -250,6 +442,7 @@ def schedule_call(request):
                 messages.error(request, 'Please correct the errors below.')
         except Exception as e:
             logger.error(f"Schedule call error: {e}")
+            FORM_SUBMISSIONS.inc(form='schedule_call', outcome='error')
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                 return JsonResponse({
                     'success': False,
@@ -269,6 +462,7 @@ def contact_us(request):
             if form.is_valid():
                 form.save()
                 
+                FORM_SUBMISSIONS.inc(form='contact', outcome='success')
                 # AJAX Response
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                     return JsonResponse({
@@ -279,6 +473,7 @@ def contact_us(request):
                 messages.success(request, '✅ Your message has been sent successfully!')
                 return redirect('landing')
             else:
+                FORM_SUBMISSIONS.inc(form='contact', outcome='invalid')
                 # AJAX Response for errors
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                     return JsonResponse({
@@ -290,6 +485,7 @@ def contact_us(request):
                 messages.error(request, 'Please correct the errors below.')
         except Exception as e:
             logger.error(f"Contact form error: {e}")
+            FORM_SUBMISSIONS.inc(form='contact', outcome='error')
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                 return JsonResponse({
                     'success': False,